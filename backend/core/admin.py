@@ -32,20 +32,26 @@ class ThemeAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_post_counts()
+
     def posts_count(self, obj):
         return obj.posts_count
 
     posts_count.short_description = "Total Posts"
+    posts_count.admin_order_field = "annotated_posts_count"
 
     def articles_count(self, obj):
         return obj.articles_count
 
     articles_count.short_description = "Articles"
+    articles_count.admin_order_field = "annotated_articles_count"
 
     def simple_posts_count(self, obj):
         return obj.simple_posts_count
 
     simple_posts_count.short_description = "Simple Posts"
+    simple_posts_count.admin_order_field = "annotated_simple_posts_count"
 
 
 @admin.register(Post)
@@ -67,6 +73,7 @@ class PostAdmin(admin.ModelAdmin):
         "theme",
         "generated_at",
     ]
+    list_select_related = ["theme"]
     search_fields = ["title", "content", "topic", "seo_title", "seo_description"]
     readonly_fields = ["created_at", "updated_at", "generated_at"]
     date_hierarchy = "post_date"
@@ -1,32 +1,325 @@
-from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import threading
+import time
+import uuid
 
-from celery.result import AsyncResult
+import msgspec
+from celery import current_app, group, states
+from celery.exceptions import TimeoutError as CeleryTimeoutError
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, transaction
+from django.db.models import Count, F, Max, Q
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.utils.cache import add_never_cache_headers, patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
-from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
-from drf_spectacular.types import OpenApiTypes
 
 from .models import Post, Theme
+from .pagination import ThemePostsPagination
+from .renderers import EventStreamRenderer, ORJSONRenderer
+from .schema import OpenApiParameter, OpenApiTypes, extend_schema, extend_schema_view
 from .serializers import (
+    BulkGenerateTopicsSerializer,
+    GenerateAllPostsSerializer,
+    GeneratePostPayload,
     GeneratePostSerializer,
     PostCreateSerializer,
     PostSerializer,
     PostUpdateSerializer,
     ThemeCreateSerializer,
+    ThemeListSerializer,
     ThemeSerializer,
 )
-from .services import get_default_ai_service
+from .services import get_default_ai_service_class
+from .signals import (
+    DASHBOARD_STATS_CACHE_KEY,
+    content_changed,
+    get_content_last_modified,
+)
 from .tasks import (
     generate_post_content_task,
+    generate_posts_batch_task,
+    generate_topics_batch_task,
     generate_topics_task,
     improve_post_content_task,
     regenerate_image_prompt_task,
 )
 
+# Seconds the dashboard statistics stay cached (also invalidated on writes)
+DASHBOARD_STATS_CACHE_TIMEOUT = 30
+
+# Upper bound (seconds) a task event stream stays open, and keep-alive period
+TASK_STREAM_MAX_SECONDS = 300
+TASK_STREAM_KEEPALIVE_SECONDS = 15
+
+# Maximum number of ids accepted by a single bulk task check
+TASK_BULK_CHECK_MAX_IDS = 100
+
+# Seconds browsers/proxies may reuse read-only responses before revalidating
+READ_ONLY_MAX_AGE = 15
+
+# Seconds a finished task status may be cached (ready results never change)
+TASK_READY_MAX_AGE = 300
+
+# Runs the independent dashboard queries concurrently (one DB connection each)
+_stats_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="stats")
+
+# Publishes Celery tasks while the request thread finishes its own DB reads
+_dispatch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dispatch")
+
+# Per-thread serializer instances reused across requests (see _post_list_serializer)
+_serializers = threading.local()
+
+# Upper bound (seconds) for the long-poll ``wait`` parameter of task checks
+TASK_CHECK_MAX_WAIT = 30
+
+# Seconds a post generation request blocks identical ones while its task runs
+GENERATE_POST_LOCK_TIMEOUT = 10 * 60
+
+# Themes sharing one AI request in bulk_generate_topics (bounded by the
+# provider's max_tokens: each theme adds 3-5 topics to the answer)
+TOPICS_BATCH_SIZE = 5
+
+
+def _claim_for_processing(queryset):
+    """
+    Atomically flags an idle row as processing with a single UPDATE.
+
+    Returns False when no idle row matched, so two concurrent requests
+    can never both mark the same row and enqueue duplicate tasks.
+    """
+    claimed = bool(
+        queryset.filter(is_processing=False).update(
+            is_processing=True,
+            processing_status="processing",
+            updated_at=timezone.now(),
+        )
+    )
+    if claimed:
+        content_changed()
+    return claimed
+
+
+def _post_generation_key(theme_id, post_type, topic):
+    return (
+        "generate-post:"
+        + hashlib.blake2b(
+            json.dumps([theme_id, post_type, topic]).encode(), digest_size=16
+        ).hexdigest()
+    )
+
+
+def _claim_post_generation(theme_id, post_type, topic, task_id=None):
+    """
+    Reserves a task id for generating this post, unless one is in flight.
+
+    Returns (task_id, claimed). Identical requests (a double click, a retried
+    request) get the running task's id back with claimed=False instead of
+    paying for a second generation; once that task is finished the key is
+    taken over by the new one. ``task_id`` lets several posts claim the same
+    (batch) task.
+    """
+    key = _post_generation_key(theme_id, post_type, topic)
+    task_id = task_id or str(uuid.uuid4())
+    if cache.add(key, task_id, GENERATE_POST_LOCK_TIMEOUT):
+        return task_id, True
+
+    running_id = cache.get(key)
+    if running_id and (
+        current_app.backend.get_task_meta(running_id)["status"]
+        not in states.READY_STATES
+    ):
+        return running_id, False
+
+    cache.set(key, task_id, GENERATE_POST_LOCK_TIMEOUT)
+    return task_id, True
+
+
+def _release_post_generation(theme_id, post_type, claims):
+    """
+    Drops the (topic, task_id) claims of tasks that were never published.
+
+    The result backend reports unknown task ids as PENDING, so a claim left
+    behind would answer "already in progress" until it expires. A key that
+    another request has taken over in the meantime is left alone.
+    """
+    for topic, task_id in claims:
+        key = _post_generation_key(theme_id, post_type, topic)
+        if cache.get(key) == task_id:
+            cache.delete(key)
+
+
+def _ai_service_name():
+    """Class name of the configured AI service (no service instance is created)"""
+    return get_default_ai_service_class().__name__
+
+
+def _run_in_db_thread(func):
+    """Wraps a query for the stats executor, honouring CONN_MAX_AGE per thread"""
+
+    def job():
+        close_old_connections()
+        try:
+            return func()
+        finally:
+            close_old_connections()
+
+    return job
+
+
+def _build_dashboard_stats_payload():
+    """Computes the stats data together with its ETag (content hash)"""
+    data = DashboardViewSet._compute_stats()
+    digest = hashlib.md5(
+        json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder).encode()
+    ).hexdigest()
+    return {"etag": f'"{digest}"', "data": data}
+
+
+def _dashboard_stats_payload():
+    """Returns the cached ``{"etag", "data"}`` stats entry, computing it on a miss"""
+    return cache.get_or_set(
+        DASHBOARD_STATS_CACHE_KEY,
+        _build_dashboard_stats_payload,
+        DASHBOARD_STATS_CACHE_TIMEOUT,
+    )
+
+
+def _dashboard_stats_etag(request):
+    return _dashboard_stats_payload()["etag"]
+
+
+def _theme_posts_etag(request, pk=None):
+    """ETag for a theme's post list: latest change plus post count, one query"""
+    row = (
+        Theme.objects.filter(pk=pk)
+        .values("updated_at")
+        .annotate(last_post=Max("posts__updated_at"), total=Count("posts"))
+        .order_by("pk")
+        .first()
+    )
+    if row is None:
+        return None
+    last_modified = max(filter(None, [row["updated_at"], row["last_post"]]))
+    return f'"{pk}-{row["total"]}-{last_modified.timestamp()}"'
+
+
+def _task_status_payload(task_id, state, value):
+    """Status entry for a task; exceptions are reported as text so it stays JSON-safe"""
+    if isinstance(value, BaseException):
+        value = f"{type(value).__name__}: {value}"
+    ready = state in states.READY_STATES
+    return {
+        "task_id": task_id,
+        "state": state,
+        "result": value if ready else None,
+        "info": value if not ready else None,
+    }
+
+
+def _post_list_serializer():
+    """
+    Per-thread PostSerializer(many=True) whose bound fields are built only once.
+
+    Callers use to_representation() directly, so no per-call data is cached
+    on the shared instance.
+    """
+    serializer = getattr(_serializers, "post_list", None)
+    if serializer is None:
+        serializer = _serializers.post_list = PostSerializer(many=True)
+    return serializer
+
+
+def _task_event(task_id, meta):
+    payload = _task_status_payload(task_id, meta["status"], meta.get("result"))
+    return f"data: {json.dumps(payload, cls=DjangoJSONEncoder)}\n\n"
+
+
+def _task_event_stream(task_id):
+    """
+    Yields server-sent events for a task until it finishes.
+
+    With the Redis result backend the generator SUBSCRIBEs to the channel
+    Celery publishes every state change on, so updates arrive as soon as they
+    are stored; other backends fall back to reading the meta once a second.
+    """
+    from celery.backends.redis import RedisBackend
+
+    backend = current_app.backend
+    meta = backend.get_task_meta(task_id)
+    yield _task_event(task_id, meta)
+    if meta["status"] in states.READY_STATES:
+        return
+
+    deadline = time.monotonic() + TASK_STREAM_MAX_SECONDS
+
+    if not isinstance(backend, RedisBackend):
+        last_status = meta["status"]
+        while time.monotonic() < deadline:
+            time.sleep(1)
+            meta = backend.get_task_meta(task_id, cache=False)
+            if meta["status"] != last_status:
+                last_status = meta["status"]
+                yield _task_event(task_id, meta)
+            if last_status in states.READY_STATES:
+                return
+        return
+
+    pubsub = backend.client.pubsub(ignore_subscribe_messages=True)
+    try:
+        pubsub.subscribe(backend.get_key_for_task(task_id))
+        # Re-read after subscribing: the task may have finished in between
+        meta = backend.get_task_meta(task_id, cache=False)
+        if meta["status"] in states.READY_STATES:
+            yield _task_event(task_id, meta)
+            return
+
+        while time.monotonic() < deadline:
+            message = pubsub.get_message(timeout=TASK_STREAM_KEEPALIVE_SECONDS)
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+            meta = backend.decode_result(message["data"])
+            yield _task_event(task_id, meta)
+            if meta["status"] in states.READY_STATES:
+                return
+    finally:
+        pubsub.close()
+
+
+def _content_etag(request, *args, **kwargs):
+    """ETag for post/theme endpoints, from the last recorded content change"""
+    return f'"{get_content_last_modified().timestamp():.6f}"'
+
+
+def _content_last_modified(request, *args, **kwargs):
+    return get_content_last_modified()
+
+
+# Conditional GET for endpoints whose payload only changes with posts/themes;
+# clients must revalidate (cheap 304) instead of reusing heuristically
+_content_conditional_get = [
+    cache_control(private=True, no_cache=True),
+    condition(etag_func=_content_etag, last_modified_func=_content_last_modified),
+]
+
+
+def _already_processing_response(model, pk, message):
+    """Answers a failed claim: 404 for a missing row, 409 when it is busy"""
+    if not model.objects.filter(pk=pk).exists():
+        raise Http404
+    return Response({"error": message}, status=status.HTTP_409_CONFLICT)
+
 
 @extend_schema_view(
     stats=extend_schema(
@@ -50,33 +343,66 @@ class DashboardViewSet(viewsets.ViewSet):
 
     permission_classes = [AllowAny]
 
+    @method_decorator(cache_control(max_age=READ_ONLY_MAX_AGE, private=True))
+    @method_decorator(condition(etag_func=_dashboard_stats_etag))
     @action(detail=False, methods=["get"])
     def stats(self, request):
         """Returns dashboard statistics"""
-        total_themes = Theme.objects.filter(is_active=True).count()
-        total_posts = Post.objects.count()
-        published_posts = Post.objects.filter(status="published").count()
-        draft_posts = Post.objects.filter(status="draft").count()
-        generated_posts = Post.objects.filter(status="generated").count()
+        return Response(_dashboard_stats_payload()["data"])
 
-        ai_service = get_default_ai_service()
-        ai_service_name = f"{type(ai_service).__name__}"
+    @staticmethod
+    def _compute_stats():
+        """Builds the statistics payload served (and cached) by stats"""
+        # One query per table instead of one per counter; posts are grouped by
+        # status so a single pass over post_status_idx yields every counter
+        queries = [
+            lambda: Theme.objects.aggregate(
+                total=Count("id", filter=Q(is_active=True))
+            ),
+            lambda: dict(
+                Post.objects.order_by()
+                .values("status")
+                .annotate(total=Count("id"))
+                .values_list("status", "total")
+            ),
+            # Preview rows straight from values(): only what the dashboard shows
+            lambda: list(
+                Post.objects.order_by("-created_at").values(
+                    "id",
+                    "title",
+                    "status",
+                    "post_type",
+                    "created_at",
+                    theme_title=F("theme__title"),
+                )[:5]
+            ),
+            lambda: list(
+                Theme.objects.filter(is_active=True)
+                .order_by("-created_at")
+                .annotate(posts_count=Count("posts"))
+                .values("id", "title", "created_at", "is_processing", "posts_count")[:5]
+            ),
+        ]
+        # The queries are independent: wall time is the slowest one, not the sum
+        futures = [
+            _stats_executor.submit(_run_in_db_thread(query)) for query in queries
+        ]
+        theme_counts, posts_by_status, recent_posts, recent_themes = [
+            future.result() for future in futures
+        ]
 
-        recent_posts = Post.objects.order_by("-created_at")[:5]
-        recent_themes = Theme.objects.filter(is_active=True).order_by("-created_at")[:5]
+        ai_service_name = _ai_service_name()
 
-        return Response(
-            {
-                "total_themes": total_themes,
-                "total_posts": total_posts,
-                "published_posts": published_posts,
-                "draft_posts": draft_posts,
-                "generated_posts": generated_posts,
-                "ai_service": ai_service_name,
-                "recent_posts": PostSerializer(recent_posts, many=True).data,
-                "recent_themes": ThemeSerializer(recent_themes, many=True).data,
-            }
-        )
+        return {
+            "total_themes": theme_counts["total"],
+            "total_posts": sum(posts_by_status.values()),
+            "published_posts": posts_by_status.get("published", 0),
+            "draft_posts": posts_by_status.get("draft", 0),
+            "generated_posts": posts_by_status.get("generated", 0),
+            "ai_service": ai_service_name,
+            "recent_posts": recent_posts,
+            "recent_themes": recent_themes,
+        }
 
 
 @extend_schema_view(
@@ -116,6 +442,18 @@ class DashboardViewSet(viewsets.ViewSet):
         responses={200: "Topic generation started successfully"},
         tags=["Themes", "AI"],
     ),
+    bulk_generate_topics=extend_schema(
+        summary="Generate Topics for Several Themes",
+        description=(
+            "Starts AI topic generation for several themes at once. Themes are "
+            "grouped a few per AI request, so themes in the same group share a "
+            "task id. Themes that are already processing (or inactive/missing) "
+            "are skipped."
+        ),
+        request=BulkGenerateTopicsSerializer,
+        responses={200: "Topic generation started for the claimed themes"},
+        tags=["Themes", "AI"],
+    ),
     generate_post=extend_schema(
         summary="Generate Post",
         description="Starts AI post generation process based on a specific topic.",
@@ -123,9 +461,43 @@ class DashboardViewSet(viewsets.ViewSet):
         responses={200: "Post generation started successfully"},
         tags=["Themes", "AI"],
     ),
+    generate_all_posts=extend_schema(
+        summary="Generate Posts for Several Topics",
+        description=(
+            "Starts AI post generation for several topics of the theme at once "
+            "(the theme's suggested topics when `topics` is omitted). Each post "
+            "is its own task and they run in parallel; topics that already "
+            "have a post of this type are skipped. With `batch`, the posts are "
+            "generated by a single task that shares one task id; on OpenAI it "
+            "uses the Batch API, which costs half as much but may take up to "
+            "24 hours."
+        ),
+        request=GenerateAllPostsSerializer,
+        responses={200: "Post generation started for the pending topics"},
+        tags=["Themes", "AI"],
+    ),
     posts=extend_schema(
         summary="Theme Posts",
-        description="Lists all posts belonging to a specific theme.",
+        description=(
+            "Lists the posts belonging to a specific theme, newest first. "
+            "Cursor-paginated: follow `next` to load older posts."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Opaque cursor taken from `next` or `previous`",
+            ),
+            OpenApiParameter(
+                name="limit",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Posts per page (default 50, max 200)",
+            ),
+        ],
         responses={200: PostSerializer(many=True)},
         tags=["Themes"],
     ),
@@ -136,6 +508,8 @@ class DashboardViewSet(viewsets.ViewSet):
         tags=["Themes"],
     ),
 )
+@method_decorator(_content_conditional_get, name="list")
+@method_decorator(_content_conditional_get, name="retrieve")
 class ThemeViewSet(viewsets.ModelViewSet):
     """
     ViewSet for complete theme management.
@@ -153,98 +527,256 @@ class ThemeViewSet(viewsets.ModelViewSet):
     permission_classes = [AllowAny]
 
     def get_queryset(self):
-        return Theme.objects.filter(is_active=True).order_by("-created_at")
+        # Post counters come from the same query instead of 3 COUNTs per theme
+        queryset = (
+            Theme.objects.filter(is_active=True)
+            .with_post_counts()
+            .order_by("-created_at")
+        )
+        if self.action == "list":
+            # Listings only show topics_count; the topics JSON stays in the DB
+            queryset = queryset.defer("suggested_topics")
+        return queryset
 
     def get_serializer_class(self):
         if self.action == "create":
             return ThemeCreateSerializer
+        if self.action == "list":
+            return ThemeListSerializer
         return ThemeSerializer
 
     @action(detail=True, methods=["post"])
     def generate_topics(self, request, pk=None):
         """Generates topics for a theme using AI"""
-        theme = get_object_or_404(Theme, pk=pk)
-
         # Mark as processing
-        theme.is_processing = True
-        theme.processing_status = "processing"
-        theme.save()
+        if not _claim_for_processing(Theme.objects.filter(pk=pk)):
+            return _already_processing_response(
+                Theme, pk, "Topic generation is already in progress for this theme."
+            )
 
-        # Start asynchronous task
-        task = generate_topics_task.delay(theme.id)
+        # Start asynchronous task (the broker publish overlaps the read below)
+        dispatch = _dispatch_executor.submit(generate_topics_task.delay, int(pk))
 
         # Message based on whether topics already exist
-        existing_count = 0
-        if theme.suggested_topics and theme.suggested_topics.get("topics"):
-            existing_count = len(theme.suggested_topics["topics"])
+        existing_count = (
+            Theme.objects.filter(pk=pk).values_list("topics_count", flat=True).get()
+        )
+
+        task = dispatch.result()
 
         return Response(
             {
                 "task_id": task.id,
                 "message": f"Topic generation started. Task ID: {task.id}",
                 "existing_topics_count": existing_count,
-                "theme_id": theme.id,
+                "theme_id": int(pk),
+            }
+        )
+
+    @action(detail=False, methods=["post"])
+    def bulk_generate_topics(self, request):
+        """Generates topics for several themes, a few themes per AI request"""
+        serializer = BulkGenerateTopicsSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        theme_ids = set(serializer.validated_data["theme_ids"])
+
+        # Lock and flag every idle theme in one transaction (two queries total)
+        with transaction.atomic():
+            claimed_ids = list(
+                Theme.objects.select_for_update()
+                .filter(pk__in=theme_ids, is_active=True, is_processing=False)
+                .values_list("id", flat=True)
+            )
+            Theme.objects.filter(pk__in=claimed_ids).update(
+                is_processing=True,
+                processing_status="processing",
+                updated_at=timezone.now(),
+            )
+        if claimed_ids:
+            content_changed()
+
+        # Up to TOPICS_BATCH_SIZE themes per task, each task a single AI
+        # request; all published on one broker connection/channel
+        tasks = []
+        with current_app.producer_or_acquire() as producer:
+            for start in range(0, len(claimed_ids), TOPICS_BATCH_SIZE):
+                batch_ids = claimed_ids[start : start + TOPICS_BATCH_SIZE]
+                task = generate_topics_batch_task.apply_async(
+                    args=(batch_ids,), producer=producer
+                )
+                tasks.extend(
+                    {"theme_id": theme_id, "task_id": task.id} for theme_id in batch_ids
+                )
+
+        return Response(
+            {
+                "message": f"Topic generation started for {len(tasks)} theme(s).",
+                "tasks": tasks,
+                "skipped_theme_ids": sorted(theme_ids.difference(claimed_ids)),
             }
         )
 
     @action(detail=True, methods=["post"])
     def generate_post(self, request, pk=None):
         """Generates a post based on a specific topic"""
-        theme = get_object_or_404(Theme, pk=pk)
+        # Only the id is needed to enqueue the task, not the theme row
+        theme_id = Theme.objects.filter(pk=pk).values_list("id", flat=True).first()
+        if theme_id is None:
+            raise Http404
+
+        body = request.data
+        if hasattr(body, "dict"):
+            # Form-encoded bodies arrive as a QueryDict of lists
+            body = body.dict()
+        try:
+            payload = msgspec.convert(body, GeneratePostPayload)
+        except msgspec.ValidationError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        topic = payload.topic
+        post_type = payload.post_type
+        topic_data = payload.topic_data
+
+        task_id, claimed = _claim_post_generation(theme_id, post_type, topic)
+        if claimed:
+            # Start asynchronous task
+            try:
+                generate_post_content_task.apply_async(
+                    args=(theme_id, topic, post_type, topic_data), task_id=task_id
+                )
+            except Exception:
+                _release_post_generation(theme_id, post_type, [(topic, task_id)])
+                raise
+            message = f"Post generation started. Task ID: {task_id}"
+        else:
+            message = f"Post generation is already in progress. Task ID: {task_id}"
 
-        serializer = GeneratePostSerializer(data=request.data)
+        return Response(
+            {
+                "task_id": task_id,
+                "message": message,
+                "theme_id": theme_id,
+                "topic": topic,
+                "post_type": post_type,
+            }
+        )
+
+    @action(detail=True, methods=["post"])
+    def generate_all_posts(self, request, pk=None):
+        """Generates a post for each of several topics, in parallel or as one batch"""
+        theme = get_object_or_404(Theme.objects.only("id", "suggested_topics"), pk=pk)
+
+        serializer = GenerateAllPostsSerializer(data=request.data)
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        post_type = serializer.validated_data["post_type"]
 
-        data = serializer.validated_data
-        topic = data["topic"]
-        post_type = data.get("post_type", "simple")
-        topic_data = data.get("topic_data")
+        # Topic title -> topic_data (the suggested topic entry, when there is one)
+        if "topics" in serializer.validated_data:
+            entries = {topic: None for topic in serializer.validated_data["topics"]}
+        else:
+            entries = {}
+            for topic in (theme.suggested_topics or {}).get("topics", []):
+                # AI-produced entries: skip anything without a string title
+                title = topic.get("title") if isinstance(topic, dict) else topic
+                if not isinstance(title, str):
+                    continue
+                entries.setdefault(title, topic if isinstance(topic, dict) else None)
+        entries = {
+            title.strip(): data for title, data in entries.items() if title.strip()
+        }
 
-        # Start asynchronous task
-        task = generate_post_content_task.delay(theme.id, topic, post_type, topic_data)
+        existing = set(
+            Post.objects.filter(
+                theme_id=theme.id, post_type=post_type, topic__in=list(entries)
+            ).values_list("topic", flat=True)
+        )
+
+        # With batch, every claimed topic goes to one generate_posts_batch_task
+        batch_task_id = (
+            str(uuid.uuid4()) if serializer.validated_data["batch"] else None
+        )
+        tasks = []
+        signatures = []
+        batch_topics = []
+        claimed_tasks = []
+        for topic, topic_data in entries.items():
+            if topic in existing:
+                continue
+            task_id, claimed = _claim_post_generation(
+                theme.id, post_type, topic, task_id=batch_task_id
+            )
+            if claimed:
+                claimed_tasks.append((topic, task_id))
+            if claimed and batch_task_id:
+                batch_topics.append(
+                    {**topic_data, "title": topic} if topic_data else topic
+                )
+            elif claimed:
+                signatures.append(
+                    generate_post_content_task.s(
+                        theme.id, topic, post_type, topic_data
+                    ).set(task_id=task_id)
+                )
+            tasks.append({"topic": topic, "task_id": task_id})
+
+        try:
+            if batch_topics:
+                generate_posts_batch_task.apply_async(
+                    args=(theme.id, batch_topics, post_type), task_id=batch_task_id
+                )
+            # One task per topic, published together; workers run them in parallel
+            if signatures:
+                group(signatures).apply_async()
+        except Exception:
+            _release_post_generation(theme.id, post_type, claimed_tasks)
+            raise
 
         return Response(
             {
-                "task_id": task.id,
-                "message": f"Post generation started. Task ID: {task.id}",
+                "message": f"Post generation started for {len(tasks)} topic(s).",
                 "theme_id": theme.id,
-                "topic": topic,
                 "post_type": post_type,
+                "tasks": tasks,
+                "skipped_topics": sorted(existing),
             }
         )
 
+    @method_decorator(cache_control(max_age=READ_ONLY_MAX_AGE, private=True))
+    @method_decorator(condition(etag_func=_theme_posts_etag))
     @action(detail=True, methods=["get"])
     def posts(self, request, pk=None):
         """Lists posts from a specific theme"""
-        theme = get_object_or_404(Theme, pk=pk)
-        posts = theme.posts.all().order_by("-created_at")
-        serializer = PostSerializer(posts, many=True)
-        return Response(serializer.data)
+        # Posts fetched through the related manager get this instance as their
+        # theme, so theme_title needs neither a JOIN nor the topics JSON
+        theme = get_object_or_404(Theme.objects.only("id", "title"), pk=pk)
+        paginator = ThemePostsPagination()
+        page = paginator.paginate_queryset(theme.posts.all(), request, view=self)
+        return paginator.get_paginated_response(
+            _post_list_serializer().to_representation(page)
+        )
 
     @action(detail=True, methods=["get"])
     def status(self, request, pk=None):
         """Checks theme processing status"""
-        theme = get_object_or_404(Theme, pk=pk)
-
-        # If marked as processing but no task for a long time, clear it
-        if theme.is_processing and theme.updated_at < timezone.now() - timedelta(
-            minutes=5
-        ):
-            theme.is_processing = False
-            theme.processing_status = "timeout"
-            theme.save()
+        # Plain dict row: status polls never build a model instance
+        theme = get_object_or_404(
+            Theme.objects.values(
+                "id", "is_processing", "processing_status", "topics_count"
+            ),
+            pk=pk,
+        )
 
         return Response(
             {
-                "theme_id": theme.id,
-                "is_processing": theme.is_processing,
-                "processing_status": theme.processing_status,
-                "status": "processing" if theme.is_processing else "completed",
-                "has_topics": bool(theme.suggested_topics),
-                "topics_count": len(theme.suggested_topics.get("topics", []))
-                if theme.suggested_topics
-                else 0,
+                "theme_id": theme["id"],
+                "is_processing": theme["is_processing"],
+                "processing_status": theme["processing_status"],
+                "status": "processing" if theme["is_processing"] else "completed",
+                "has_topics": theme["topics_count"] > 0,
+                "topics_count": theme["topics_count"],
             }
         )
 
@@ -305,6 +837,8 @@ class ThemeViewSet(viewsets.ModelViewSet):
         tags=["Posts"],
     ),
 )
+@method_decorator(_content_conditional_get, name="list")
+@method_decorator(_content_conditional_get, name="retrieve")
 class PostViewSet(viewsets.ModelViewSet):
     """
     ViewSet for complete post management.
@@ -322,7 +856,13 @@ class PostViewSet(viewsets.ModelViewSet):
     """
 
     permission_classes = [AllowAny]
-    queryset = Post.objects.all().order_by("-created_at")
+    # The serializer only reads theme.title; the theme's topics JSON can be
+    # large and would otherwise be repeated on every joined row
+    queryset = (
+        Post.objects.select_related("theme")
+        .defer("theme__suggested_topics")
+        .order_by("-created_at")
+    )
 
     def get_serializer_class(self):
         if self.action == "create":
@@ -334,47 +874,56 @@ class PostViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["post"])
     def improve(self, request, pk=None):
         """Improves post content using AI"""
-        post = get_object_or_404(Post, pk=pk)
-
         # Mark as processing
-        post.is_processing = True
-        post.processing_status = "processing"
-        post.save()
+        if not _claim_for_processing(Post.objects.filter(pk=pk)):
+            return _already_processing_response(
+                Post, pk, "This post is already being processed."
+            )
 
         # Start asynchronous task
-        task = improve_post_content_task.delay(post.id)
+        task = improve_post_content_task.delay(int(pk))
 
         return Response(
             {
                 "task_id": task.id,
                 "message": f"Post improvement started. Task ID: {task.id}",
-                "post_id": post.id,
+                "post_id": int(pk),
             }
         )
 
     @action(detail=True, methods=["post"])
     def regenerate_image_prompt(self, request, pk=None):
         """Generates or regenerates cover image prompt for article"""
-        post = get_object_or_404(Post, pk=pk)
-
-        # Check if it's an article
-        if post.post_type != "article":
+        # Mark as processing (only articles can be claimed)
+        if not _claim_for_processing(Post.objects.filter(pk=pk, post_type="article")):
+            post_type = (
+                Post.objects.filter(pk=pk).values_list("post_type", flat=True).first()
+            )
+            if post_type is None:
+                raise Http404
+            # Check if it's an article
+            if post_type != "article":
+                return Response(
+                    {"error": "Only articles can have cover image prompt."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             return Response(
-                {"error": "Only articles can have cover image prompt."},
-                status=status.HTTP_400_BAD_REQUEST,
+                {"error": "This post is already being processed."},
+                status=status.HTTP_409_CONFLICT,
             )
 
-        # Mark as processing
-        post.is_processing = True
-        post.processing_status = "processing"
-        post.save()
+        # Start asynchronous task (the broker publish overlaps the read below)
+        dispatch = _dispatch_executor.submit(
+            regenerate_image_prompt_task.delay, int(pk)
+        )
 
-        # Start asynchronous task
-        task = regenerate_image_prompt_task.delay(post.id)
+        post = Post.objects.only("id", "cover_image_prompt").get(pk=pk)
 
         is_first_generation = not post.cover_image_prompt
         action_type = "generation" if is_first_generation else "regeneration"
 
+        task = dispatch.result()
+
         return Response(
             {
                 "task_id": task.id,
@@ -387,11 +936,13 @@ class PostViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["post"])
     def publish(self, request, pk=None):
         """Publishes a post"""
-        post = get_object_or_404(Post, pk=pk)
+        post = get_object_or_404(
+            Post.objects.only("id", "title", "status", "post_date"), pk=pk
+        )
 
         post.status = "published"
         post.post_date = timezone.now()
-        post.save()
+        post.save(update_fields=["status", "post_date", "updated_at"])
 
         return Response(
             {
@@ -404,24 +955,23 @@ class PostViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"])
     def status(self, request, pk=None):
         """Checks post processing status"""
-        post = get_object_or_404(Post, pk=pk)
-
-        # If marked as processing but no task for a long time, clear it
-        if post.is_processing and post.updated_at < timezone.now() - timedelta(
-            minutes=5
-        ):
-            post.is_processing = False
-            post.processing_status = "timeout"
-            post.save()
+        # content_length is a stored column, so the text itself is never loaded;
+        # the row comes back as a plain dict, skipping model instantiation
+        post = get_object_or_404(
+            Post.objects.values(
+                "id", "is_processing", "processing_status", "title", "content_length"
+            ),
+            pk=pk,
+        )
 
         return Response(
             {
-                "post_id": post.id,
-                "is_processing": post.is_processing,
-                "processing_status": post.processing_status,
-                "status": "processing" if post.is_processing else "completed",
-                "title": post.title,
-                "content_length": len(post.content) if post.content else 0,
+                "post_id": post["id"],
+                "is_processing": post["is_processing"],
+                "processing_status": post["processing_status"],
+                "status": "processing" if post["is_processing"] else "completed",
+                "title": post["title"],
+                "content_length": post["content_length"],
             }
         )
 
@@ -437,11 +987,58 @@ class PostViewSet(viewsets.ModelViewSet):
                 location=OpenApiParameter.QUERY,
                 required=True,
                 description="Celery task ID to check",
-            )
+            ),
+            OpenApiParameter(
+                name="wait",
+                type=OpenApiTypes.FLOAT,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description=(
+                    "Long-poll: block up to this many seconds (max 30) "
+                    "until the task finishes before answering"
+                ),
+            ),
         ],
         responses={200: "Task status retrieved successfully"},
         tags=["Tasks"],
-    )
+    ),
+    stream=extend_schema(
+        summary="Stream Task Status",
+        description=(
+            "Server-sent events stream with the task status: one event now and "
+            "one per state change, pushed as soon as the worker stores it. "
+            "The stream closes when the task finishes (or after 5 minutes)."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="task_id",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=True,
+                description="Celery task ID to follow",
+            ),
+        ],
+        responses={200: "Event stream of task statuses"},
+        tags=["Tasks"],
+    ),
+    bulk_check=extend_schema(
+        summary="Check Several Task Statuses",
+        description=(
+            "Checks the status of several Celery tasks at once, reading all "
+            "results from the backend in a single round trip."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="task_ids",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=True,
+                description="Comma-separated Celery task IDs (max 100)",
+            ),
+        ],
+        responses={200: "Task statuses retrieved successfully"},
+        tags=["Tasks"],
+    ),
 )
 class TaskStatusViewSet(viewsets.ViewSet):
     """
@@ -472,13 +1069,108 @@ class TaskStatusViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        task_result = AsyncResult(task_id)
+        try:
+            wait = min(float(request.query_params.get("wait", 0)), TASK_CHECK_MAX_WAIT)
+        except ValueError:
+            return Response(
+                {"error": "wait parameter must be a number"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        response_data = {
-            "task_id": task_id,
-            "state": task_result.state,
-            "result": task_result.result if task_result.ready() else None,
-            "info": task_result.info if not task_result.ready() else None,
-        }
+        # A single backend read gives state and result together, instead of
+        # separate lookups for state/ready()/result/info
+        backend = current_app.backend
+        meta = backend.get_task_meta(task_id)
+
+        # Long-poll: the result backend notifies completion, so the client
+        # gets the answer as soon as it exists instead of on its next poll
+        if wait > 0 and meta["status"] not in states.READY_STATES:
+            from celery.result import AsyncResult
+
+            try:
+                AsyncResult(task_id).get(timeout=wait, interval=0.05, propagate=False)
+            except CeleryTimeoutError:
+                pass
+            else:
+                meta = backend.get_task_meta(task_id)
+
+        response_data = _task_status_payload(
+            task_id, meta["status"], meta.get("result")
+        )
+
+        response = Response(response_data)
+        # Finished results are final; in-flight states must always be re-fetched
+        if meta["status"] in states.READY_STATES:
+            patch_cache_control(response, max_age=TASK_READY_MAX_AGE, private=True)
+        else:
+            add_never_cache_headers(response)
+        return response
 
-        return Response(response_data)
+    @action(
+        detail=False,
+        methods=["get"],
+        renderer_classes=[ORJSONRenderer, EventStreamRenderer],
+    )
+    def stream(self, request):
+        """Pushes Celery task status changes as server-sent events"""
+        task_id = request.query_params.get("task_id")
+
+        if not task_id:
+            return Response(
+                {"error": "task_id parameter is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        response = StreamingHttpResponse(
+            _task_event_stream(task_id), content_type="text/event-stream"
+        )
+        add_never_cache_headers(response)
+        # Tell nginx not to buffer the stream
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    @action(detail=False, methods=["get"])
+    def bulk_check(self, request):
+        """Checks the status of several Celery tasks in one backend round trip"""
+        task_ids = [
+            task_id.strip()
+            for task_id in request.query_params.get("task_ids", "").split(",")
+            if task_id.strip()
+        ]
+
+        if not task_ids:
+            return Response(
+                {"error": "task_ids parameter is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(task_ids) > TASK_BULK_CHECK_MAX_IDS:
+            return Response(
+                {"error": f"At most {TASK_BULK_CHECK_MAX_IDS} task_ids are allowed"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        from celery.backends.base import KeyValueStoreBackend
+
+        backend = current_app.backend
+        if isinstance(backend, KeyValueStoreBackend):
+            # One MGET for every result key instead of one GET per task
+            keys = [backend.get_key_for_task(task_id) for task_id in task_ids]
+            raw_values = backend.mget(keys)
+            if hasattr(raw_values, "get"):
+                # Some key/value backends answer with a {key: value} mapping
+                raw_values = [raw_values.get(key) for key in keys]
+            metas = [
+                backend.decode_result(raw) if raw else {"status": states.PENDING}
+                for raw in raw_values
+            ]
+        else:
+            metas = [backend.get_task_meta(task_id) for task_id in task_ids]
+
+        return Response(
+            {
+                "tasks": [
+                    _task_status_payload(task_id, meta["status"], meta.get("result"))
+                    for task_id, meta in zip(task_ids, metas)
+                ]
+            }
+        )
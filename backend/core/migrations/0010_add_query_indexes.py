@@ -0,0 +1,33 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_add_ai_provider_field"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(fields=["status"], name="post_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(fields=["-created_at"], name="post_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["is_processing", "updated_at"], name="post_processing_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="theme",
+            index=models.Index(
+                fields=["is_active", "-created_at"], name="theme_active_created_idx"
+            ),
+        ),
+    ]
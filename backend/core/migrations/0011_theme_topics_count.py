@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:54
+
+from django.db import migrations, models
+
+
+def backfill_topics_count(apps, schema_editor):
+    Theme = apps.get_model("core", "Theme")
+    themes = list(Theme.objects.exclude(suggested_topics=None).only("suggested_topics"))
+    for theme in themes:
+        theme.topics_count = len((theme.suggested_topics or {}).get("topics", []))
+    Theme.objects.bulk_update(themes, ["topics_count"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_add_query_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="theme",
+            name="topics_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Topics count"
+            ),
+        ),
+        migrations.RunPython(backfill_topics_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:55
+
+from django.db import migrations, models
+from django.db.models.functions import Length
+
+
+def backfill_content_length(apps, schema_editor):
+    Post = apps.get_model("core", "Post")
+    Post.objects.update(content_length=Length("content"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0011_theme_topics_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="content_length",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Content length"
+            ),
+        ),
+        migrations.RunPython(backfill_content_length, migrations.RunPython.noop),
+    ]
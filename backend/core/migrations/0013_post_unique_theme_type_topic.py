@@ -0,0 +1,43 @@
+# Generated by Django 5.2.5 on 2026-10-15 23:16
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def disambiguate_duplicate_topics(apps, schema_editor):
+    # Posts created before the constraint may share theme, type and topic;
+    # keep the oldest one as is and suffix the topic of the others
+    Post = apps.get_model("core", "Post")
+    duplicates = (
+        Post.objects.order_by()
+        .values("theme_id", "post_type", "topic")
+        .annotate(total=Count("id"))
+        .filter(total__gt=1)
+    )
+    for group in duplicates:
+        posts = Post.objects.filter(
+            theme_id=group["theme_id"],
+            post_type=group["post_type"],
+            topic=group["topic"],
+        ).order_by("created_at", "id")
+        for number, post in enumerate(posts[1:], start=2):
+            suffix = f" ({number})"
+            post.topic = post.topic[: 200 - len(suffix)] + suffix
+            post.save(update_fields=["topic"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0012_post_content_length"),
+    ]
+
+    operations = [
+        migrations.RunPython(disambiguate_duplicate_topics, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="post",
+            constraint=models.UniqueConstraint(
+                fields=("theme", "post_type", "topic"), name="uniq_theme_type_topic"
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-15 23:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0013_post_unique_theme_type_topic"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="theme",
+            index=models.Index(
+                fields=["is_processing", "updated_at"], name="theme_processing_idx"
+            ),
+        ),
+    ]
@@ -2,6 +2,20 @@ from django.db import models
 from django.utils import timezone
 
 
+class ThemeQuerySet(models.QuerySet):
+    def with_post_counts(self):
+        """Annotates the post counters in the same query (see Theme.posts_count)"""
+        return self.annotate(
+            annotated_posts_count=models.Count("posts"),
+            annotated_articles_count=models.Count(
+                "posts", filter=models.Q(posts__post_type="article")
+            ),
+            annotated_simple_posts_count=models.Count(
+                "posts", filter=models.Q(posts__post_type="simple")
+            ),
+        )
+
+
 class Theme(models.Model):
     """Model for post themes"""
 
@@ -38,28 +52,59 @@ class Theme(models.Model):
     topics_generated_at = models.DateTimeField(
         null=True, blank=True, verbose_name="Topics generated at"
     )
+    # Kept in sync with suggested_topics on save, so listings can skip the JSON
+    topics_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Topics count"
+    )
+
+    objects = ThemeQuerySet.as_manager()
 
     class Meta:
         verbose_name = "Theme"
         verbose_name_plural = "Themes"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["is_active", "-created_at"], name="theme_active_created_idx"
+            ),
+            models.Index(
+                fields=["is_processing", "updated_at"], name="theme_processing_idx"
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # Refresh the stored topics counter whenever the topics are written
+        update_fields = kwargs.get("update_fields")
+        if "suggested_topics" not in self.get_deferred_fields() and (
+            update_fields is None or "suggested_topics" in update_fields
+        ):
+            self.topics_count = len((self.suggested_topics or {}).get("topics", []))
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "topics_count"}
+        super().save(*args, **kwargs)
+
     @property
     def posts_count(self):
         """Returns the total number of posts related to this theme"""
+        if hasattr(self, "annotated_posts_count"):
+            return self.annotated_posts_count
         return self.posts.count()
 
     @property
     def articles_count(self):
         """Returns the number of articles related to this theme"""
+        if hasattr(self, "annotated_articles_count"):
+            return self.annotated_articles_count
         return self.posts.filter(post_type="article").count()
 
     @property
     def simple_posts_count(self):
         """Returns the number of simple posts related to this theme"""
+        if hasattr(self, "annotated_simple_posts_count"):
+            return self.annotated_simple_posts_count
         return self.posts.filter(post_type="simple").count()
 
 
@@ -94,6 +139,10 @@ class Post(models.Model):
     )
     title = models.CharField(max_length=200, verbose_name="Title")
     content = models.TextField(verbose_name="Content")
+    # Kept in sync with content on save, so status polls don't read the text
+    content_length = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Content length"
+    )
     promotional_post = models.TextField(
         blank=True,
         verbose_name="Promotional Post",
@@ -176,6 +225,18 @@ class Post(models.Model):
         verbose_name = "Post"
         verbose_name_plural = "Posts"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status"], name="post_status_idx"),
+            models.Index(fields=["-created_at"], name="post_created_idx"),
+            models.Index(
+                fields=["is_processing", "updated_at"], name="post_processing_idx"
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["theme", "post_type", "topic"], name="uniq_theme_type_topic"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.get_post_type_display()})"
@@ -184,6 +245,15 @@ class Post(models.Model):
         # If being generated for the first time, set generation date
         if self.status == "generated" and not self.generated_at:
             self.generated_at = timezone.now()
+
+        # Refresh the stored length whenever the content is written
+        update_fields = kwargs.get("update_fields")
+        if "content" not in self.get_deferred_fields() and (
+            update_fields is None or "content" in update_fields
+        ):
+            self.content_length = len(self.content or "")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "content_length"}
         super().save(*args, **kwargs)
 
     @property
@@ -0,0 +1,15 @@
+from rest_framework.pagination import CursorPagination
+
+
+class ThemePostsPagination(CursorPagination):
+    """
+    Keyset pagination for a theme's posts.
+
+    Pages are fetched with ``WHERE created_at < <cursor>`` instead of OFFSET,
+    so deep pages cost the same as the first one.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 50
+    page_size_query_param = "limit"
+    max_page_size = 200
@@ -0,0 +1,47 @@
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson.
+
+    Datetimes, UUIDs and dataclasses are encoded natively; anything else
+    (Decimal, lazy translations, querysets...) falls back to DRF's encoder.
+    """
+
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context):
+            options |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=options)
+
+        # Same as DRF: keep the output a strict JavaScript subset
+        return ret.replace("\u2028".encode(), b"\\u2028").replace(
+            "\u2029".encode(), b"\\u2029"
+        )
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Lets server-sent event endpoints accept ``text/event-stream`` requests.
+
+    Successful responses are streamed by the view itself; this only renders
+    error payloads (e.g. validation errors) as a single ``error`` event.
+    """
+
+    media_type = "text/event-stream"
+    format = "event-stream"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return b"event: error\ndata: " + orjson.dumps(data) + b"\n\n"
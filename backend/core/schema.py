@@ -0,0 +1,37 @@
+"""
+OpenAPI decorators used by the API views.
+
+With ``settings.GENERATE_OPENAPI_SCHEMA`` disabled (production) these are
+no-ops: the drf-spectacular metadata is discarded at import instead of being
+attached to every view and kept for the lifetime of each worker.
+"""
+
+from django.conf import settings
+
+if settings.GENERATE_OPENAPI_SCHEMA:
+    from drf_spectacular.types import OpenApiTypes
+    from drf_spectacular.utils import (
+        OpenApiParameter,
+        extend_schema,
+        extend_schema_view,
+    )
+else:
+
+    def extend_schema(*args, **kwargs):
+        return lambda target: target
+
+    def extend_schema_view(**kwargs):
+        return lambda view: view
+
+    class _Noop:
+        """Absorbs attribute access and calls (OpenApiParameter.QUERY, ...)"""
+
+        def __getattr__(self, name):
+            return self
+
+        def __call__(self, *args, **kwargs):
+            return self
+
+    OpenApiParameter = OpenApiTypes = _Noop()
+
+__all__ = ["OpenApiParameter", "OpenApiTypes", "extend_schema", "extend_schema_view"]
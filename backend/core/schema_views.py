@@ -0,0 +1,44 @@
+import threading
+
+from django.utils import translation
+from drf_spectacular.views import SpectacularAPIView
+from rest_framework.response import Response
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """
+    SpectacularAPIView that generates the schema once per process.
+
+    The schema only changes on deploy, so the (expensive) introspection of
+    every view runs on the first request per version/language and later
+    requests just render the memoized document.
+    """
+
+    _schemas = {}
+    _lock = threading.Lock()
+
+    def _get_schema_response(self, request):
+        version = (
+            self.api_version or request.version or self._get_version_parameter(request)
+        )
+        key = (version, translation.get_language())
+        schema = self._schemas.get(key)
+        if schema is None:
+            with self._lock:
+                schema = self._schemas.get(key)
+                if schema is None:
+                    generator = self.generator_class(
+                        urlconf=self.urlconf,
+                        api_version=version,
+                        patterns=self.patterns,
+                    )
+                    schema = generator.get_schema(
+                        request=request, public=self.serve_public
+                    )
+                    self._schemas[key] = schema
+        return Response(
+            data=schema,
+            headers={
+                "Content-Disposition": f'inline; filename="{self._get_filename(request, version)}"'
+            },
+        )
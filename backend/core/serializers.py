@@ -1,8 +1,30 @@
+from copy import copy
+from typing import Any, Literal
+
+import msgspec
 from rest_framework import serializers
 from .models import Theme, Post
 
 
-class ThemeSerializer(serializers.ModelSerializer):
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that introspects the model only once per class.
+
+    The generated (unbound) fields are cached per serializer class and each
+    instance receives shallow copies, so binding stays per instance.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cached = self._fields_cache.get(self.__class__)
+        if cached is None:
+            cached = super().get_fields()
+            self._fields_cache[self.__class__] = cached
+        return {name: copy(field) for name, field in cached.items()}
+
+
+class ThemeSerializer(CachedFieldsModelSerializer):
     posts_count = serializers.ReadOnlyField()
     articles_count = serializers.ReadOnlyField()
     simple_posts_count = serializers.ReadOnlyField()
@@ -19,6 +41,7 @@ class ThemeSerializer(serializers.ModelSerializer):
             "is_processing",
             "suggested_topics",
             "topics_generated_at",
+            "topics_count",
             "posts_count",
             "articles_count",
             "simple_posts_count",
@@ -31,16 +54,28 @@ class ThemeSerializer(serializers.ModelSerializer):
             "is_processing",
             "suggested_topics",
             "topics_generated_at",
+            "topics_count",
+        ]
+
+
+class ThemeListSerializer(ThemeSerializer):
+    """Theme listing without the (potentially large) suggested_topics JSON"""
+
+    class Meta(ThemeSerializer.Meta):
+        fields = [
+            field
+            for field in ThemeSerializer.Meta.fields
+            if field != "suggested_topics"
         ]
 
 
-class ThemeCreateSerializer(serializers.ModelSerializer):
+class ThemeCreateSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = Theme
         fields = ["title"]
 
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(CachedFieldsModelSerializer):
     theme_title = serializers.CharField(source="theme.title", read_only=True)
 
     class Meta:
@@ -85,13 +120,13 @@ class PostSerializer(serializers.ModelSerializer):
         ]
 
 
-class PostCreateSerializer(serializers.ModelSerializer):
+class PostCreateSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = Post
         fields = ["theme", "topic", "post_type"]
 
 
-class PostUpdateSerializer(serializers.ModelSerializer):
+class PostUpdateSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = Post
         fields = [
@@ -123,6 +158,37 @@ class GeneratePostSerializer(serializers.Serializer):
     topic_data = serializers.JSONField(required=False)
 
 
+class GeneratePostPayload(msgspec.Struct, forbid_unknown_fields=False):
+    """
+    Fast validator for the generate_post body (same rules as
+    GeneratePostSerializer, which remains the documented request schema)
+    """
+
+    topic: str
+    post_type: Literal["simple", "article"] = "simple"
+    topic_data: Any = None
+
+    def __post_init__(self):
+        self.topic = self.topic.strip()
+        if not self.topic:
+            raise ValueError("`topic` may not be blank")
+
+
+class BulkGenerateTopicsSerializer(serializers.Serializer):
+    theme_ids = serializers.ListField(
+        child=serializers.IntegerField(), min_length=1, max_length=50
+    )
+
+
+class GenerateAllPostsSerializer(serializers.Serializer):
+    post_type = serializers.ChoiceField(choices=["simple", "article"], default="simple")
+    topics = serializers.ListField(
+        child=serializers.CharField(), required=False, min_length=1, max_length=50
+    )
+    # One task for all the posts (the OpenAI Batch API: half price, up to 24h)
+    batch = serializers.BooleanField(default=False)
+
+
 class ImprovePostSerializer(serializers.Serializer):
     post_id = serializers.IntegerField()
 
@@ -1,164 +1,668 @@
+import hashlib
 import json
 import logging
 import re
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Type
 
 import openai
+import orjson
 import requests
 from django.conf import settings
+from django.core.cache import cache
+from json_repair import loads as repair_loads
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+from tenacity.wait import wait_base
 
 logger = logging.getLogger(__name__)
 
+# orjson parses and serializes several times faster than the stdlib; its
+# JSONDecodeError subclasses json.JSONDecodeError, so handlers stay the same
+_loads = orjson.loads
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj).decode()
+
+
+# Control characters other than tab, newline and carriage return, plus DEL
+_CTRL_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(32) if c not in (9, 10, 13)) + "\x7f"
+)
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[a-zA-Z]")
+_TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+# Friendly summaries for improve_post_content failures, checked in order
+_IMPROVE_ERROR_PATTERNS = [
+    (
+        re.compile("Invalid control character"),
+        "AI response contained invalid control characters. This is usually a temporary API issue.",
+    ),
+    (re.compile("timeout", re.I), "Request timed out. Please try again."),
+    (
+        re.compile("rate limit", re.I),
+        "API rate limit exceeded. Please wait a moment and try again.",
+    ),
+    (
+        re.compile("api key", re.I),
+        "API authentication error. Please check configuration.",
+    ),
+]
+_IMPROVED_CONTENT_RE = re.compile(
+    r'"improved_content"\s*:\s*"(.*?)"(?=\s*,|\s*})', re.DOTALL
+)
+
+
+def _strip_fences(content: str) -> str:
+    """Removes markdown code fences (with or without a language tag) and whitespace"""
+    return (
+        content.strip()
+        .removeprefix("```json")
+        .removeprefix("```")
+        .removesuffix("```")
+        .strip()
+    )
+
+
+def _extract_outermost_obj(content: str) -> str:
+    """Drops any chatter before the first ``{`` and after the last ``}``"""
+    start = content.find("{")
+    end = content.rfind("}")
+    if start == -1:
+        return content
+    return content[start : end + 1] if end > start else content[start:]
+
+
+def _autoclose(content: str) -> str:
+    """
+    Appends the closers a truncated response is missing, innermost first.
+
+    Brackets inside string values are not counted, and a string cut off
+    mid-value is closed before its containers.
+    """
+    stack = []
+    in_string = escaped = False
+    for char in content:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]" and stack and stack[-1] == char:
+            stack.pop()
+    if in_string:
+        # A dangling backslash would escape the closing quote
+        content = (content[:-1] if escaped else content) + '"'
+    return content + "".join(reversed(stack))
+
+
+def _heuristic_repair(content: str) -> str:
+    """
+    Cheap fixes for the most common LLM JSON defects.
+
+    Each step is a single linear pass, so it is tried before the full
+    json_repair parser.
+    """
+    content = _autoclose(_extract_outermost_obj(content))
+    # After closing, so a comma the truncation left dangling is caught too
+    return _TRAILING_COMMA_RE.sub(r"\1", content)
+
 
 def clean_json_response(content: str) -> str:
     """
-    Clean and prepare AI response content for JSON parsing with aggressive fallback
+    Clean and prepare AI response content for JSON parsing.
+
+    Well-formed responses are returned untouched; anything else is handed to
+    json_repair, which fixes stray text, trailing commas, unescaped quotes and
+    control characters in a single pass.
     """
     if not content:
         return content
 
-    # Remove markdown code blocks if present
-    if content.startswith("```json"):
-        content = content[7:]
-    if content.endswith("```"):
-        content = content[:-3]
-
-    # Remove any leading/trailing whitespace
-    content = content.strip()
-
-    # First attempt: Standard cleaning
-    # Remove known control characters by their byte values
-    chars_to_remove = [
-        "\x00",
-        "\x01",
-        "\x02",
-        "\x03",
-        "\x04",
-        "\x05",
-        "\x06",
-        "\x07",
-        "\x08",
-        "\x0b",
-        "\x0c",
-        "\x0e",
-        "\x0f",
-        "\x10",
-        "\x11",
-        "\x12",
-        "\x13",
-        "\x14",
-        "\x15",
-        "\x16",
-        "\x17",
-        "\x18",
-        "\x19",
-        "\x1a",
-        "\x1b",
-        "\x1c",
-        "\x1d",
-        "\x1e",
-        "\x1f",
-        "\x7f",
-    ]
-
-    for char in chars_to_remove:
-        content = content.replace(char, "")
-
-    # Use regex to catch any remaining control characters
-    content = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]", "", content)
-
-    # Remove ANSI escape sequences
-    content = re.sub(r"\x1b\[[0-9;]*[a-zA-Z]", "", content)
-
-    # Fix escape sequences but preserve valid JSON escapes
-    content = re.sub(r"\\(?![\"\\\/bfnrt])", "", content)
-
-    # Try to parse - if successful, return
+    content = _strip_fences(content)
+
+    # Fast path: most responses are already valid JSON
     try:
-        json.loads(content)
+        _loads(content)
         return content
     except json.JSONDecodeError:
-        logger.warning(
-            "Standard JSON cleaning failed, attempting aggressive reconstruction"
+        logger.warning("AI response is not valid JSON, attempting repair")
+
+    # ANSI escape sequences are not JSON syntax json_repair can recover from;
+    # they go first, since the control-character pass would eat their ESC byte
+    content = _ANSI_RE.sub("", content).translate(_CTRL_TABLE)
+
+    candidate = _heuristic_repair(content)
+    try:
+        _loads(candidate)
+        return candidate
+    except json.JSONDecodeError:
+        pass
+
+    repaired = repair_loads(content)
+    if not repaired:
+        logger.error("Could not repair AI response into JSON")
+        return content
+
+    return _dumps(repaired)
+
+
+# Provider errors worth another attempt: throttling, timeouts and outages
+_RETRYABLE_EXCEPTIONS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRY_AFTER_MAX_SECONDS = 60
+
+# Terminal OpenAI Batch API states that will never produce results
+OPENAI_BATCH_FAILED_STATUSES = {"failed", "expired", "cancelling", "cancelled"}
+
+# How long deterministic (temperature 0) answers are reused by default
+DETERMINISTIC_CACHE_TTL = 60 * 60
+
+# Minimum seconds between partial-text snapshots handed to on_progress
+STREAM_PROGRESS_INTERVAL = 1.0
+
+# Request options that change how the answer is read, not the answer itself
+_TRANSPORT_KWARGS = {"stream", "on_progress"}
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, _RETRYABLE_EXCEPTIONS):
+        return True
+    if isinstance(exc, requests.exceptions.HTTPError) and exc.response is not None:
+        return exc.response.status_code in _RETRYABLE_STATUS_CODES
+    return False
+
+
+def _retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Seconds from a Retry-After header on the failed response, if any"""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(float(headers.get("retry-after")), 0.0)
+    except (TypeError, ValueError):
+        # Missing, or the HTTP-date form: use the exponential schedule
+        return None
+
+
+class wait_retry_after(wait_base):
+    """Honours the server's Retry-After when given, else defers to ``fallback``"""
+
+    def __init__(self, fallback: wait_base):
+        self.fallback = fallback
+
+    def __call__(self, retry_state) -> float:
+        retry_after = _retry_after_seconds(retry_state.outcome.exception())
+        if retry_after is not None:
+            return min(retry_after, RETRY_AFTER_MAX_SECONDS)
+        return self.fallback(retry_state)
+
+
+def _build_session() -> requests.Session:
+    """
+    Pooled HTTP session for a provider API.
+
+    The pool is sized for the concurrent calls made by generate_posts_bulk and
+    threaded workers. Retries stay with tenacity in AIServiceBase._send, so
+    urllib3's own retries are left off to avoid multiplying attempts.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=64)
+    session.mount("https://", adapter)
+    return session
+
+
+class _JSONObjectScanner:
+    """
+    Spots the end of the first top-level JSON object in streamed text.
+
+    Braces inside string literals (and escaped quotes) are ignored, so the
+    scanner can be fed arbitrary chunk boundaries.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> Optional[int]:
+        """
+        Offset in ``text`` just past the ``}`` closing the object opened by
+        the first ``{``, or None while it is still open
+        """
+        for index, char in enumerate(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = self.started
+            elif char == "{":
+                self.depth += 1
+                self.started = True
+            elif char == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return index + 1
+        return None
+
+
+def _iter_sse_data(response: requests.Response) -> Iterable[Dict]:
+    """Decoded ``data:`` payloads of a server-sent events response"""
+    for line in response.iter_lines():
+        if not line.startswith(b"data:"):
+            continue
+        payload = line[5:].strip()
+        if payload == b"[DONE]":
+            return
+        yield _loads(payload)
+
+
+def _collect_stream(
+    deltas: Iterable[str], on_progress: Optional[Callable[[str], None]] = None
+) -> str:
+    """
+    Joins streamed text deltas into the completion.
+
+    Stops as soon as the first JSON object is complete (trailing chatter is
+    never waited for) and, when ``on_progress`` is given, hands it the text
+    received so far at most every STREAM_PROGRESS_INTERVAL seconds.
+    """
+    parts = []
+    scanner = _JSONObjectScanner()
+    last_progress = time.monotonic()
+    for delta in deltas:
+        if not delta:
+            continue
+        end = scanner.feed(delta)
+        if end is not None:
+            # Keep the object, not whatever follows it in the same chunk
+            parts.append(delta[:end])
+            break
+        parts.append(delta)
+        if on_progress is not None:
+            now = time.monotonic()
+            if now - last_progress >= STREAM_PROGRESS_INTERVAL:
+                last_progress = now
+                on_progress("".join(parts))
+    return "".join(parts)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: ``rate`` tokens per ``per`` seconds.
+
+    The bucket starts full, so short bursts go through immediately; after
+    that acquire() blocks just long enough to stay under the rate.
+    """
+
+    def __init__(self, rate: float, per: float = 60.0):
+        self.capacity = float(rate)
+        self.tokens = float(rate)
+        self.fill_rate = rate / per
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.fill_rate
         )
+        self.updated = now
+
+    def acquire(self, tokens: float = 1.0):
+        # Oversized requests are clamped so they wait for a full bucket at most
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.fill_rate
+            time.sleep(wait)
+
+    def limit_remaining(self, remaining: float):
+        """Never allow more than the server says is left in its window"""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, float(remaining))
+
+
+# Static prompt text, built once at import; only the per-call slots are formatted
+_SIMPLE_POST_TEMPLATE = """
+            Create a simple LinkedIn post following this template:
+            
+            1. Catchy opening hook (1-2 lines)
+            2. Topic development (2-3 short paragraphs)
+            3. Call to action or question for engagement
+            4. Relevant hashtags (3-5 hashtags)
+            
+            The post must have a maximum of 1300 characters and be engaging.
+            Tone: conversational, accessible, and direct.
+            """
 
-        # Fallback: Ultra-aggressive cleaning by reconstructing character by character
-        safe_chars = []
-        for char in content:
-            ascii_code = ord(char)
-            # Keep only safe ASCII characters, spaces, tabs, newlines and carriage returns
-            if (ascii_code >= 32 and ascii_code <= 126) or char in [
-                "\n",
-                "\t",
-                "\r",
-                " ",
-            ]:
-                safe_chars.append(char)
-
-        reconstructed = "".join(safe_chars)
-
-        # Try again
-        try:
-            json.loads(reconstructed)
-            return reconstructed
-        except json.JSONDecodeError:
-            # Last resort: Extract content manually and rebuild JSON
-            logger.warning(
-                "JSON parsing still failed, attempting manual reconstruction"
-            )
+_ARTICLE_TEMPLATE = """
+            Create a comprehensive LinkedIn article following this template:
+            
+            **ARTICLE STRUCTURE:**
+            1. Catchy and professional title
+            2. Introduction presenting the problem/opportunity (200-250 words)
+            3. 3-4 well-developed main points with examples (800-1000 words total)
+            4. Conclusion with practical insights and actionable takeaways (200-250 words)
+            5. Call to action for engagement
+            
+            **ALSO CREATE A PROMOTIONAL POST:**
+            Additionally, create a short promotional LinkedIn post (max 1300 characters) to promote this article.
+            The promotional post should:
+            - Hook readers with an intriguing question or statement
+            - Briefly tease the main value/insights of the article
+            - Include a clear call-to-action to read the full article
+            - End with relevant hashtags (6-8)
+            
+            **COVER IMAGE PROMPT:**
+            Create a detailed description for an AI image generator to create a professional cover image for this article.
+            
+            CRITICAL RULE - NO TEXT IN IMAGE:
+            ❌ NEVER include text, titles, letters, or words in the image
+            ❌ DO NOT show the article title or any written content
+            ✅ Focus purely on visual elements, symbols, and abstract representations
+            
+            The description should be:
+            - Visual-only elements that represent the technical topic
+            - Abstract or realistic approach (but never textual)
+            - Professional modern aesthetic suitable for LinkedIn
+            - Specific colors, style, and composition details
+            - Clean, minimalist design without any text
+            - 120-200 words describing only visual elements
+            
+            The article should be between 1500-2000 words, informative and professional.
+            Tone: conversational, accessible, and direct.
+            """
 
-            try:
-                # Extract "improved_content" and "improvement_summary" using regex
-                content_match = re.search(
-                    r'"improved_content"\s*:\s*"(.*?)"(?=\s*,)',
-                    reconstructed,
-                    re.DOTALL,
-                )
-                summary_match = re.search(
-                    r'"improvement_summary"\s*:\s*"(.*?)"', reconstructed, re.DOTALL
-                )
+_POST_SYSTEM_MESSAGE = "You are an expert in technical content creation for LinkedIn. Always respond only with valid JSON. You are creating a {post_type} for developers. All prompts and generated content must be in English."
 
-                if content_match and summary_match:
-                    improved_content = content_match.group(1)
-                    summary = summary_match.group(1)
+_IMPROVE_PROMPT = """
+        You are an expert technical content creator and code reviewer, specialized in creating secure, production-ready content for developers.
 
-                    # Clean up the extracted content
-                    improved_content = improved_content.replace('"', '"')
-                    summary = summary.replace('"', '"')
+        **TASK:** Enhance and improve the following {post_type} content with enhanced details, practical examples, and secure code.
 
-                    # Create a clean JSON structure
-                    clean_data = {
-                        "improved_content": improved_content,
-                        "improvement_summary": summary,
-                    }
+        **ENHANCEMENT REQUIREMENTS:**
+        1. **Extend with More Details**: Add deeper explanations for each key point
+        2. **Practical Examples**: Include real-world scenarios with working code examples
+        3. **Security-First Code**: All code must be rigorously secure and follow best practices
+        4. **Error-Free Implementation**: Code should be production-ready, tested, and robust
+        5. **Technical Depth**: Explain the "why" and "how" behind each concept
+        6. **Markdown Formatting**: Use proper Markdown syntax for better readability
+
+        **CURRENT CONTENT TO IMPROVE:**
+        Title: "{post_title}"
+        Topic: "{topic}"
+        Content: "{current_content}"
+
+        **CODE QUALITY STANDARDS:**
+        - Include proper error handling
+        - Use secure coding practices (input validation, sanitization, etc.)
+        - Add comments explaining critical sections
+        - Follow language-specific best practices
+        - Include edge case handling
+        - Use meaningful variable names
+        - Implement proper logging where applicable
+
+        **FORMATTING GUIDELINES:**
+        - Use # ## ### for headers
+        - Use ```language for code blocks with proper language specification
+        - Use **bold** for emphasis
+        - Use `inline code` for technical terms
+        - Use > for important notes/warnings
+        - Use - or * for bullet points
+        - Add horizontal rules (---) between major sections
+
+        **OUTPUT STRUCTURE:**
+        {content_kind} should be significantly enhanced with:
+        - More comprehensive explanations
+        - Additional practical examples
+        - Security considerations
+        - Performance tips
+        - Common pitfalls to avoid
+        - Related concepts and connections
+        - Relevant hashtags (6-8 relevant hashtags)
+
+        **CRITICAL:** Return only valid JSON. No markdown code blocks, no additional text, just the JSON object.
+
+        Return the improved content in this exact JSON format:
+        {{
+            "improved_content": "Enhanced content in Markdown format with detailed explanations and secure code examples",
+            "improvement_summary": "Brief summary of key improvements made"
+        }}
 
-                    result = json.dumps(clean_data, ensure_ascii=False)
-                    logger.info("Successfully reconstructed JSON manually")
-                    return result
-                else:
-                    logger.error("Could not extract content using regex")
-                    return reconstructed
-            except Exception as e:
-                logger.error(f"Manual JSON reconstruction failed: {e}")
-                return reconstructed
+        **TARGET AUDIENCE:**
+        - Junior to Senior developers
+        - DevOps engineers
+        - Technical leads
+        - Security-conscious developers
+
+        All content must be in English and technically accurate.
+        """
+
+_IMPROVE_SYSTEM_MESSAGE = "You are an expert technical content creator and security-focused code reviewer. You MUST respond with valid JSON only. Never include markdown code blocks or any text outside the JSON object. Always ensure your JSON is properly formatted and escaped."
 
-    return content
+_IMAGE_PROMPT_SYSTEM_MESSAGE = "You are an expert visual designer and AI prompt engineer. NEVER include text in image descriptions. Always respond with valid JSON. Create detailed, text-free professional image generation prompts."
 
 
 class AIServiceBase(ABC):
     """Base class for AI service providers"""
 
+    # Sampling settings shared by every provider request
+    temperature = 0.7
+    max_tokens = 4000
+
+    # Fallback answers when a provider returns nothing or fails
+    IMAGE_PROMPT_FALLBACK = "Abstract professional illustration representing {topic} concept through visual elements only, modern minimalist style, corporate color palette, no text, clean composition, high quality digital art"
+    IMAGE_PROMPT_FALLBACK_ELEMENTS = "Abstract shapes and symbols related to the topic"
+
+    # Per-provider limiters and HTTP sessions, shared by every instance in the
+    # process (services are created per task, connections should outlive them)
+    _rate_limiters: Dict[str, tuple] = {}
+    _rate_limiters_lock = threading.Lock()
+    _sessions: Dict[str, requests.Session] = {}
+    _sessions_lock = threading.Lock()
+
     def __init__(self, api_key: str, model: str):
         self.api_key = api_key
         self.model = model
-        print(f"Using AI service provider: {type(self).__name__}")
+        logger.debug("Using AI service provider: %s", type(self).__name__)
 
     @abstractmethod
-    def _make_request(self, messages: List[Dict], **kwargs) -> str:
-        """Make API request to the AI provider"""
+    def _make_request(
+        self,
+        messages: List[Dict],
+        stream: bool = False,
+        on_progress: Optional[Callable[[str], None]] = None,
+        **kwargs,
+    ) -> str:
+        """
+        Make API request to the AI provider.
+
+        ``stream`` reads the completion incrementally, passing the partial
+        text to ``on_progress`` as it arrives; the return value is the same
+        text either way.
+        """
         pass
 
+    @classmethod
+    def _get_rate_limiters(cls):
+        """
+        (requests, tokens, concurrency) limiters for this provider: two token
+        buckets and a semaphore, each None when unlimited
+        """
+        key = cls.__name__
+        limiters = cls._rate_limiters.get(key)
+        if limiters is None:
+            with cls._rate_limiters_lock:
+                limiters = cls._rate_limiters.get(key)
+                if limiters is None:
+                    rpm = getattr(settings, "AI_RPM", 0)
+                    tpm = getattr(settings, "AI_TPM", 0)
+                    concurrency = getattr(settings, "AI_MAX_CONCURRENCY", 0)
+                    limiters = (
+                        TokenBucket(rpm) if rpm else None,
+                        TokenBucket(tpm) if tpm else None,
+                        (
+                            threading.BoundedSemaphore(concurrency)
+                            if concurrency
+                            else None
+                        ),
+                    )
+                    cls._rate_limiters[key] = limiters
+        return limiters
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Process-wide pooled session for this provider, built on first use"""
+        key = cls.__name__
+        session = cls._sessions.get(key)
+        if session is None:
+            with cls._sessions_lock:
+                session = cls._sessions.get(key)
+                if session is None:
+                    session = cls._sessions[key] = _build_session()
+        return session
+
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=wait_retry_after(wait_exponential(multiplier=1, min=1, max=30)),
+        retry=retry_if_exception(_is_retryable),
+        reraise=True,
+    )
+    def _send(self, messages: List[Dict], **kwargs) -> str:
+        """
+        Rate-limited entry point for provider requests.
+
+        Throttling, timeouts and 5xx responses are retried with exponential
+        backoff (or the server's Retry-After); other errors propagate at once.
+        The semaphore is held for the request only, not while backing off.
+        """
+        requests_bucket, tokens_bucket, concurrency = self._get_rate_limiters()
+        if requests_bucket:
+            requests_bucket.acquire()
+        if tokens_bucket:
+            # Rough prompt size: ~4 characters per token
+            tokens_bucket.acquire(
+                sum(len(message["content"]) for message in messages) / 4
+            )
+        if concurrency is None:
+            return self._make_request(messages, **kwargs)
+        with concurrency:
+            return self._make_request(messages, **kwargs)
+
+    def _make_request_cached(
+        self,
+        messages: List[Dict],
+        no_cache: bool = False,
+        on_progress: Optional[Callable[[str], None]] = None,
+        **kwargs,
+    ) -> str:
+        """
+        Like _send, but identical requests are answered from the Django cache.
+
+        Passing ``on_progress`` streams the completion and reports the partial
+        text while it is generated (cache hits return at once, without it).
+
+        Enabled by settings.AI_CACHE_TTL (seconds, 0 disables it); services
+        running at temperature 0 are deterministic and always cached, for
+        DETERMINISTIC_CACHE_TTL unless the setting says otherwise. Hits skip
+        both the provider round-trip and the rate limiter; retried tasks and
+        repeated generations no longer pay for the same completion twice.
+        """
+        if on_progress is not None:
+            kwargs.update(stream=True, on_progress=on_progress)
+
+        timeout = getattr(settings, "AI_CACHE_TTL", 0)
+        if not timeout and self.temperature == 0:
+            timeout = DETERMINISTIC_CACHE_TTL
+        if not timeout or no_cache:
+            return self._send(messages, **kwargs)
+
+        key = (
+            "ai:"
+            + hashlib.blake2b(
+                orjson.dumps(
+                    [
+                        type(self).__name__,
+                        self.model,
+                        self.temperature,
+                        self.max_tokens,
+                        messages,
+                        {k: v for k, v in kwargs.items() if k not in _TRANSPORT_KWARGS},
+                    ],
+                    option=orjson.OPT_SORT_KEYS,
+                ),
+                digest_size=16,
+            ).hexdigest()
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._send(messages, **kwargs)
+        if result:
+            cache.set(key, result, timeout)
+        return result
+
+    def _observe_rate_limit_headers(self, headers):
+        """Tighten the local buckets from x-ratelimit-remaining-* headers"""
+        requests_bucket, tokens_bucket, _ = self._get_rate_limiters()
+        for bucket, header in (
+            (requests_bucket, "x-ratelimit-remaining-requests"),
+            (tokens_bucket, "x-ratelimit-remaining-tokens"),
+        ):
+            value = headers.get(header)
+            if bucket and value is not None:
+                try:
+                    bucket.limit_remaining(float(value))
+                except ValueError:
+                    pass
+
+    @staticmethod
+    def _fallback_post_content(topic) -> Dict:
+        return {
+            "title": f"Post about {topic}",
+            "content": f"Content about {topic} will be generated soon.",
+            "seo_title": topic[:60],
+            "seo_description": f"Learn more about {topic}"[:160],
+        }
+
+    def _fallback_image_prompt(self, topic, style_notes: str) -> Dict:
+        return {
+            "cover_image_prompt": self.IMAGE_PROMPT_FALLBACK.format(topic=topic),
+            "style_notes": style_notes,
+            "visual_elements": self.IMAGE_PROMPT_FALLBACK_ELEMENTS,
+        }
+
     def generate_topics(
         self, theme_title: str, existing_topics: Optional[List] = None
     ) -> Dict:
@@ -223,76 +727,147 @@ class AIServiceBase(ABC):
         messages = [{"role": "user", "content": prompt}]
 
         try:
-            response_text = self._make_request(messages)
-            return json.loads(response_text)
+            response_text = self._make_request_cached(messages)
+            return _loads(response_text)
         except json.JSONDecodeError:
             # Try to extract JSON from response
             start = response_text.find("{")
             end = response_text.rfind("}") + 1
             if start != -1 and end != 0:
                 try:
-                    return json.loads(response_text[start:end])
+                    return _loads(response_text[start:end])
                 except json.JSONDecodeError:
                     pass
             return {"topics": []}
         except Exception as e:
-            print(f"Error generating topics: {e}")
+            logger.error("Error generating topics: %s", e)
             return {"topics": []}
 
-    def generate_post_content(self, topic, post_type, theme_title, topic_data=None):
+    def generate_topics_batch(
+        self,
+        theme_titles: List[str],
+        existing_topics: Optional[List[Optional[List]]] = None,
+    ) -> List[Dict]:
+        """
+        Generate topics for several themes with a single request.
+
+        Returns one ``{"topics": [...]}`` dict per title, in the same order;
+        themes the model skipped come back with an empty list.
+        """
+        if not theme_titles:
+            return []
+        existing_topics = existing_topics or [None] * len(theme_titles)
+        if len(theme_titles) == 1:
+            return [self.generate_topics(theme_titles[0], existing_topics[0])]
+
+        theme_lines = []
+        for index, (title, existing) in enumerate(
+            zip(theme_titles, existing_topics), start=1
+        ):
+            line = f'{index}. "{title}"'
+            existing_titles = [
+                topic["title"] if isinstance(topic, dict) else topic
+                for topic in existing or []
+                if isinstance(topic, str)
+                or (isinstance(topic, dict) and "title" in topic)
+            ]
+            if existing_titles:
+                line += f" (already suggested, avoid: {'; '.join(existing_titles)})"
+            theme_lines.append(line)
+
+        prompt = f"""
+        You are an expert in technical content creation for LinkedIn, focused on developers.
+
+        **Themes/Stacks:**
+        {(chr(10) + " " * 8).join(theme_lines)}
+
+        **Target Audience:**
+        - Junior developers
+        - Senior engineers  
+        - General tech professionals
+
+        **Task:**
+        For EACH theme above, generate 3 to 5 new specific topics for weekly LinkedIn posts. Each topic should include:
+        1. **Title/Topic** - Clear and specific title
+        2. **Suggested Hook** - Catchy question or statement to start the post
+        3. **Post Type** - Type of post (tip, lesson, comparison, concept explanation, best practice, etc.)
+        4. **One-sentence Summary** - One sentence summary of the main idea
+        5. **Suggested CTA** - Engaging call to action for the end of the post
+
+        **Desired Tone:**
+        - Conversational, accessible, and direct
+        - Focused on real problems developers face
+        - Practical and applicable
+
+        Return in JSON format, one entry per theme in the same order:
+        {{
+            "themes": [
+                {{
+                    "theme": "Theme title exactly as given",
+                    "topics": [
+                        {{
+                            "title": "Specific topic title",
+                            "hook": "Catchy question or statement",
+                            "post_type": "tip/lesson/comparison/concept/best_practice",
+                            "summary": "One sentence summary of the topic",
+                            "cta": "Engaging call to action"
+                        }}
+                    ]
+                }}
+            ]
+        }}
+        """
+
+        messages = [{"role": "user", "content": prompt}]
+
+        try:
+            data = _loads(clean_json_response(self._make_request_cached(messages)))
+            entries = data.get("themes", []) if isinstance(data, dict) else []
+        except Exception as e:
+            logger.error("Error generating topics in batch: %s", e)
+            entries = []
+
+        # Match by title first, falling back to position for reworded titles
+        by_title = {
+            entry.get("theme"): entry for entry in entries if isinstance(entry, dict)
+        }
+        matched = {id(by_title[title]) for title in theme_titles if title in by_title}
+        results = []
+        for index, title in enumerate(theme_titles):
+            entry = by_title.get(title)
+            if entry is None and index < len(entries):
+                if id(entries[index]) not in matched:
+                    entry = entries[index]
+            topics = entry.get("topics") if isinstance(entry, dict) else None
+            results.append({"topics": topics if isinstance(topics, list) else []})
+        return results
+
+    def generate_post_content(
+        self, topic, post_type, theme_title, topic_data=None, on_progress=None
+    ):
         """
         Second agent: Generates post content based on the topic and template
         """
+        messages = self.build_post_content_messages(
+            topic, post_type, theme_title, topic_data
+        )
+
+        try:
+            return self.parse_post_content(
+                self._make_request_cached(messages, on_progress=on_progress), topic
+            )
+        except Exception as e:
+            logger.error("Error generating content: %s", e)
+            return self._fallback_post_content(topic)
+
+    def build_post_content_messages(
+        self, topic, post_type, theme_title, topic_data=None
+    ) -> List[Dict]:
+        """Chat messages asking for a post/article on ``topic``"""
         if post_type == "simple":
-            template_prompt = """
-            Create a simple LinkedIn post following this template:
-            
-            1. Catchy opening hook (1-2 lines)
-            2. Topic development (2-3 short paragraphs)
-            3. Call to action or question for engagement
-            4. Relevant hashtags (3-5 hashtags)
-            
-            The post must have a maximum of 1300 characters and be engaging.
-            Tone: conversational, accessible, and direct.
-            """
+            template_prompt = _SIMPLE_POST_TEMPLATE
         else:  # article
-            template_prompt = """
-            Create a comprehensive LinkedIn article following this template:
-            
-            **ARTICLE STRUCTURE:**
-            1. Catchy and professional title
-            2. Introduction presenting the problem/opportunity (200-250 words)
-            3. 3-4 well-developed main points with examples (800-1000 words total)
-            4. Conclusion with practical insights and actionable takeaways (200-250 words)
-            5. Call to action for engagement
-            
-            **ALSO CREATE A PROMOTIONAL POST:**
-            Additionally, create a short promotional LinkedIn post (max 1300 characters) to promote this article.
-            The promotional post should:
-            - Hook readers with an intriguing question or statement
-            - Briefly tease the main value/insights of the article
-            - Include a clear call-to-action to read the full article
-            - End with relevant hashtags (6-8)
-            
-            **COVER IMAGE PROMPT:**
-            Create a detailed description for an AI image generator to create a professional cover image for this article.
-            
-            CRITICAL RULE - NO TEXT IN IMAGE:
-            ❌ NEVER include text, titles, letters, or words in the image
-            ❌ DO NOT show the article title or any written content
-            ✅ Focus purely on visual elements, symbols, and abstract representations
-            
-            The description should be:
-            - Visual-only elements that represent the technical topic
-            - Abstract or realistic approach (but never textual)
-            - Professional modern aesthetic suitable for LinkedIn
-            - Specific colors, style, and composition details
-            - Clean, minimalist design without any text
-            - 120-200 words describing only visual elements
-            
-            The article should be between 1500-2000 words, informative and professional.
-            Tone: conversational, accessible, and direct.
-            """
+            template_prompt = _ARTICLE_TEMPLATE
 
         # Build the prompt with structured topic data if available
         topic_context = ""
@@ -348,131 +923,82 @@ class AIServiceBase(ABC):
         messages = [
             {
                 "role": "system",
-                "content": f"You are an expert in technical content creation for LinkedIn. Always respond only with valid JSON. You are creating a {post_type} for developers. All prompts and generated content must be in English.",
+                "content": _POST_SYSTEM_MESSAGE.format(post_type=post_type),
             },
             {"role": "user", "content": prompt},
         ]
 
-        try:
-            content = self._make_request(messages)
-            if content:
-                content = content.strip()
-                # Remove possible markdown code blocks
-                if content.startswith("```json"):
-                    content = content[7:]
-                if content.endswith("```"):
-                    content = content[:-3]
-
-                return json.loads(content)
-            else:
-                return {
-                    "title": f"Post about {topic}",
-                    "content": f"Content about {topic} will be generated soon.",
-                    "seo_title": topic[:60],
-                    "seo_description": f"Learn more about {topic}"[:160],
-                }
+        return messages
 
-        except Exception as e:
-            print(f"Error generating content: {e}")
-            return {
-                "title": f"Post about {topic}",
-                "content": f"Content about {topic} will be generated soon.",
-                "seo_title": topic[:60],
-                "seo_description": f"Learn more about {topic}"[:160],
-            }
+    def parse_post_content(self, content: Optional[str], topic) -> Dict:
+        """Turns a generate_post_content completion into its content dict"""
+        if not content:
+            return self._fallback_post_content(topic)
+        return _loads(_strip_fences(content))
 
-    def improve_post_content(self, current_content, post_title, post_type, topic):
-        """
-        Third agent: Improves existing post content with enhanced details, practical examples, and secure code
+    def generate_posts_bulk(
+        self, topics: List, post_type: str, theme_title: str, max_workers: int = 5
+    ) -> List[Dict]:
         """
-        improvement_prompt = f"""
-        You are an expert technical content creator and code reviewer, specialized in creating secure, production-ready content for developers.
-
-        **TASK:** Enhance and improve the following {post_type} content with enhanced details, practical examples, and secure code.
+        Generate content for several topics concurrently.
 
-        **ENHANCEMENT REQUIREMENTS:**
-        1. **Extend with More Details**: Add deeper explanations for each key point
-        2. **Practical Examples**: Include real-world scenarios with working code examples
-        3. **Security-First Code**: All code must be rigorously secure and follow best practices
-        4. **Error-Free Implementation**: Code should be production-ready, tested, and robust
-        5. **Technical Depth**: Explain the "why" and "how" behind each concept
-        6. **Markdown Formatting**: Use proper Markdown syntax for better readability
-
-        **CURRENT CONTENT TO IMPROVE:**
-        Title: "{post_title}"
-        Topic: "{topic}"
-        Content: "{current_content}"
-
-        **CODE QUALITY STANDARDS:**
-        - Include proper error handling
-        - Use secure coding practices (input validation, sanitization, etc.)
-        - Add comments explaining critical sections
-        - Follow language-specific best practices
-        - Include edge case handling
-        - Use meaningful variable names
-        - Implement proper logging where applicable
-
-        **FORMATTING GUIDELINES:**
-        - Use # ## ### for headers
-        - Use ```language for code blocks with proper language specification
-        - Use **bold** for emphasis
-        - Use `inline code` for technical terms
-        - Use > for important notes/warnings
-        - Use - or * for bullet points
-        - Add horizontal rules (---) between major sections
-
-        **OUTPUT STRUCTURE:**
-        {"article" if post_type == "article" else "simple post"} should be significantly enhanced with:
-        - More comprehensive explanations
-        - Additional practical examples
-        - Security considerations
-        - Performance tips
-        - Common pitfalls to avoid
-        - Related concepts and connections
-        - Relevant hashtags (6-8 relevant hashtags)
-
-        **CRITICAL:** Return only valid JSON. No markdown code blocks, no additional text, just the JSON object.
+        ``topics`` holds topic titles or topic dicts (as stored in
+        ``suggested_topics``). The requests are network-bound, so running them
+        side by side makes the batch take about as long as its slowest post.
+        Results keep the order of ``topics``.
+        """
+        if not topics:
+            return []
 
-        Return the improved content in this exact JSON format:
-        {{
-            "improved_content": "Enhanced content in Markdown format with detailed explanations and secure code examples",
-            "improvement_summary": "Brief summary of key improvements made"
-        }}
+        def generate(topic):
+            if isinstance(topic, dict):
+                return self.generate_post_content(
+                    topic.get("title", ""), post_type, theme_title, topic
+                )
+            return self.generate_post_content(topic, post_type, theme_title)
 
-        **TARGET AUDIENCE:**
-        - Junior to Senior developers
-        - DevOps engineers
-        - Technical leads
-        - Security-conscious developers
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(topics))) as pool:
+            return list(pool.map(generate, topics))
 
-        All content must be in English and technically accurate.
+    def improve_post_content(
+        self, current_content, post_title, post_type, topic, on_progress=None
+    ):
         """
+        Third agent: Improves existing post content with enhanced details, practical examples, and secure code
+        """
+        improvement_prompt = _IMPROVE_PROMPT.format(
+            post_type=post_type,
+            post_title=post_title,
+            topic=topic,
+            current_content=current_content,
+            content_kind="article" if post_type == "article" else "simple post",
+        )
 
         messages = [
             {
                 "role": "system",
-                "content": "You are an expert technical content creator and security-focused code reviewer. You MUST respond with valid JSON only. Never include markdown code blocks or any text outside the JSON object. Always ensure your JSON is properly formatted and escaped.",
+                "content": _IMPROVE_SYSTEM_MESSAGE,
             },
             {"role": "user", "content": improvement_prompt},
         ]
 
         try:
-            content = self._make_request(messages)
+            content = self._make_request_cached(messages, on_progress=on_progress)
             if content:
                 content = clean_json_response(content)
 
                 # Try to parse JSON
                 try:
-                    parsed = json.loads(content)
+                    parsed = _loads(content)
                     # Additional validation: ensure required keys exist
                     if isinstance(parsed, dict) and "improved_content" in parsed:
                         return parsed
                     else:
                         raise json.JSONDecodeError("Missing required keys", content, 0)
                 except json.JSONDecodeError as json_error:
-                    logger.warning(f"JSON decode error: {json_error}")
+                    logger.warning("JSON decode error: %s", json_error)
                     logger.warning(
-                        f"Raw content that failed to parse: {content[:500]}..."
+                        "Raw content that failed to parse: %s...", content[:500]
                     )
 
                     # Try to extract JSON from response if it's embedded in text
@@ -483,7 +1009,7 @@ class AIServiceBase(ABC):
                             extracted_json = content[start:end]
                             extracted_json = clean_json_response(extracted_json)
 
-                            parsed = json.loads(extracted_json)
+                            parsed = _loads(extracted_json)
                             if (
                                 isinstance(parsed, dict)
                                 and "improved_content" in parsed
@@ -504,11 +1030,7 @@ class AIServiceBase(ABC):
                     # If JSON parsing still fails, try to salvage content with regex
                     try:
                         # Extract content between quotes after "improved_content"
-                        content_match = re.search(
-                            r'"improved_content"\s*:\s*"(.*?)"(?=\s*,|\s*})',
-                            content,
-                            re.DOTALL,
-                        )
+                        content_match = _IMPROVED_CONTENT_RE.search(content)
                         if content_match:
                             improved_text = content_match.group(1)
                             # Unescape the content properly
@@ -526,7 +1048,7 @@ class AIServiceBase(ABC):
                                 "improvement_summary": "Content extracted using fallback parsing due to JSON format issues.",
                             }
                     except Exception as e:
-                        logger.error(f"Fallback content extraction failed: {e}")
+                        logger.error("Fallback content extraction failed: %s", e)
 
                     # If all parsing fails, return error with details
                     error_msg = f"JSON parsing failed: {str(json_error)}. The AI response contained invalid characters or format."
@@ -543,21 +1065,17 @@ class AIServiceBase(ABC):
 
         except Exception as e:
             error_message = str(e)
-            print(f"Error improving content: {error_message}")
+            logger.error("Error improving content: %s", error_message)
 
             # Provide more specific error information
-            if "Invalid control character" in error_message:
-                error_summary = "AI response contained invalid control characters. This is usually a temporary API issue."
-            elif "timeout" in error_message.lower():
-                error_summary = "Request timed out. Please try again."
-            elif "rate limit" in error_message.lower():
-                error_summary = (
-                    "API rate limit exceeded. Please wait a moment and try again."
-                )
-            elif "api key" in error_message.lower():
-                error_summary = "API authentication error. Please check configuration."
-            else:
-                error_summary = f"Unexpected error: {error_message}"
+            error_summary = next(
+                (
+                    summary
+                    for pattern, summary in _IMPROVE_ERROR_PATTERNS
+                    if pattern.search(error_message)
+                ),
+                f"Unexpected error: {error_message}",
+            )
 
             return {
                 "improved_content": current_content,
@@ -628,36 +1146,29 @@ class AIServiceBase(ABC):
         messages = [
             {
                 "role": "system",
-                "content": "You are an expert visual designer and AI prompt engineer. NEVER include text in image descriptions. Always respond with valid JSON. Create detailed, text-free professional image generation prompts.",
+                "content": _IMAGE_PROMPT_SYSTEM_MESSAGE,
             },
             {"role": "user", "content": regeneration_prompt},
         ]
 
         try:
-            content = self._make_request(messages)
+            content = self._make_request_cached(messages)
             if content:
-                content = content.strip()
-                # Remove possible markdown code blocks
-                if content.startswith("```json"):
-                    content = content[7:]
-                if content.endswith("```"):
-                    content = content[:-3]
-
-                return json.loads(content)
+                content = _strip_fences(content)
+
+                return _loads(content)
             else:
-                return {
-                    "cover_image_prompt": f"Abstract professional illustration representing {topic} concept through visual elements only, modern minimalist style, corporate color palette, no text, clean composition, high quality digital art",
-                    "style_notes": "Could not generate new prompt at this time - using fallback visual-only prompt.",
-                    "visual_elements": "Abstract shapes and symbols related to the topic",
-                }
+                return self._fallback_image_prompt(
+                    topic,
+                    "Could not generate new prompt at this time - using fallback visual-only prompt.",
+                )
 
         except Exception as e:
-            print(f"Error regenerating image prompt: {e}")
-            return {
-                "cover_image_prompt": f"Abstract professional illustration representing {topic} concept through visual elements only, modern minimalist style, corporate color palette, no text, clean composition, high quality digital art",
-                "style_notes": "Error occurred during generation - using fallback visual-only prompt.",
-                "visual_elements": "Abstract shapes and symbols related to the topic",
-            }
+            logger.error("Error regenerating image prompt: %s", e)
+            return self._fallback_image_prompt(
+                topic,
+                "Error occurred during generation - using fallback visual-only prompt.",
+            )
 
 
 class OpenAIService(AIServiceBase):
@@ -666,19 +1177,125 @@ class OpenAIService(AIServiceBase):
     def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4"):
         super().__init__(api_key=api_key or settings.OPENAI_API_KEY, model=model)
         openai.api_key = self.api_key
-        self.client = openai.OpenAI(api_key=self.api_key)
+        # Retries are handled by _send, not stacked with the SDK's own
+        self.client = openai.OpenAI(api_key=self.api_key, max_retries=0)
+
+    def _make_request(
+        self,
+        messages: List[Dict],
+        stream: bool = False,
+        on_progress: Optional[Callable[[str], None]] = None,
+        **kwargs,
+    ) -> str:
+        """
+        Make request to OpenAI API.
 
-    def _make_request(self, messages: List[Dict], **kwargs) -> str:
-        """Make request to OpenAI API"""
-        response = self.client.chat.completions.create(
+        With ``stream=True`` the completion is read as it is generated and the
+        request ends as soon as the JSON object is complete, instead of
+        waiting for the whole body (and any trailing chatter) to arrive.
+        """
+        if stream:
+            return self._read_stream(messages, on_progress, **kwargs)
+
+        raw_response = self.client.chat.completions.with_raw_response.create(
             model=self.model,
             messages=messages,
-            temperature=0.7,
-            max_tokens=4000,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
             **kwargs,
         )
+        self._observe_rate_limit_headers(raw_response.headers)
+        response = raw_response.parse()
         return response.choices[0].message.content
 
+    def submit_batch(self, requests_by_id: Dict[str, List[Dict]]) -> str:
+        """
+        Queue chat completions on the OpenAI Batch API.
+
+        ``requests_by_id`` maps a custom_id to its messages. Batched requests
+        cost half as much and are answered within 24 hours; the returned batch
+        id is polled with get_batch_results.
+        """
+        lines = [
+            _dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": messages,
+                        "temperature": self.temperature,
+                        "max_tokens": self.max_tokens,
+                    },
+                }
+            )
+            for custom_id, messages in requests_by_id.items()
+        ]
+        batch_file = self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode()), purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    def get_batch_results(self, batch_id: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Completion text per custom_id once the batch has finished.
+
+        Returns None while the batch is still running and raises if it failed,
+        expired or was cancelled; requests that errored inside a finished
+        batch map to None.
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status in OPENAI_BATCH_FAILED_STATUSES:
+            raise RuntimeError(f"OpenAI batch {batch_id} ended as {batch.status}")
+        if batch.status != "completed":
+            return None
+
+        results = {}
+        if batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = _loads(line)
+                response = record.get("response") or {}
+                choices = (response.get("body") or {}).get("choices") or []
+                results[record["custom_id"]] = (
+                    choices[0]["message"]["content"]
+                    if response.get("status_code") == 200 and choices
+                    else None
+                )
+        return results
+
+    def _read_stream(
+        self,
+        messages: List[Dict],
+        on_progress: Optional[Callable[[str], None]] = None,
+        **kwargs,
+    ) -> str:
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stream=True,
+            **kwargs,
+        )
+        self._observe_rate_limit_headers(response.response.headers)
+
+        try:
+            return _collect_stream(
+                (chunk.choices[0].delta.content for chunk in response if chunk.choices),
+                on_progress,
+            )
+        finally:
+            response.close()
+
 
 class GrokService(AIServiceBase):
     """Service for integration with Grok (X.AI) API"""
@@ -688,29 +1305,64 @@ class GrokService(AIServiceBase):
             api_key=api_key or getattr(settings, "GROK_API_KEY", ""), model=model
         )
         self.base_url = "https://api.x.ai/v1"
-
-    def _make_request(self, messages: List[Dict], **kwargs) -> str:
-        """Make request to Grok API"""
-        headers = {
+        self._session = self._get_session()
+        # The session is shared by every GrokService, so auth travels per request
+        self._headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
 
+    def _make_request(
+        self,
+        messages: List[Dict],
+        stream: bool = False,
+        on_progress: Optional[Callable[[str], None]] = None,
+        **kwargs,
+    ) -> str:
+        """Make request to Grok API (server-sent events when ``stream`` is set)"""
         data = {
             "model": self.model,
             "messages": messages,
-            "temperature": 0.7,
-            "max_tokens": 4000,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
             **kwargs,
         }
+        if stream:
+            data["stream"] = True
+
+        with self._session.post(
+            f"{self.base_url}/chat/completions",
+            headers=self._headers,
+            data=orjson.dumps(data),
+            timeout=120,
+            stream=stream,
+        ) as response:
+            self._observe_rate_limit_headers(response.headers)
+            response.raise_for_status()
+
+            if stream:
+                return _collect_stream(
+                    (
+                        event["choices"][0]["delta"].get("content")
+                        for event in _iter_sse_data(response)
+                        if event.get("choices")
+                    ),
+                    on_progress,
+                )
+
+            result = orjson.loads(response.content)
+            return result["choices"][0]["message"]["content"]
 
-        response = requests.post(
-            f"{self.base_url}/chat/completions", headers=headers, json=data, timeout=120
-        )
-        response.raise_for_status()
 
-        result = response.json()
-        return result["choices"][0]["message"]["content"]
+# OpenAI chat roles -> Gemini content roles ("system" is sent separately)
+_GEMINI_ROLES = {"user": "user", "assistant": "model"}
+
+
+def _gemini_text(event: Dict) -> str:
+    """Text carried by one streamGenerateContent event (the last may have none)"""
+    candidates = event.get("candidates") or [{}]
+    parts = (candidates[0].get("content") or {}).get("parts") or []
+    return "".join(part.get("text", "") for part in parts)
 
 
 class GeminiService(AIServiceBase):
@@ -721,34 +1373,64 @@ class GeminiService(AIServiceBase):
             api_key=api_key or getattr(settings, "GEMINI_API_KEY", ""), model=model
         )
         self.base_url = "https://generativelanguage.googleapis.com/v1beta"
-
-    def _make_request(self, messages: List[Dict], **kwargs) -> str:
-        """Make request to Gemini API"""
-        # Convert OpenAI-style messages to Gemini format
-        gemini_messages = []
-        for msg in messages:
-            if msg["role"] == "user":
-                gemini_messages.append(
-                    {"role": "user", "parts": [{"text": msg["content"]}]}
-                )
-            elif msg["role"] == "assistant":
-                gemini_messages.append(
-                    {"role": "model", "parts": [{"text": msg["content"]}]}
-                )
+        self._session = self._get_session()
+
+    def _make_request(
+        self,
+        messages: List[Dict],
+        stream: bool = False,
+        on_progress: Optional[Callable[[str], None]] = None,
+        **kwargs,
+    ) -> str:
+        """
+        Make request to Gemini API (streamGenerateContent when ``stream`` is set)
+        """
+        # Convert OpenAI-style messages to Gemini format; system prompts go to
+        # systemInstruction, which is where Gemini expects them
+        gemini_messages = [
+            {"role": _GEMINI_ROLES[msg["role"]], "parts": [{"text": msg["content"]}]}
+            for msg in messages
+            if msg["role"] in _GEMINI_ROLES
+        ]
+        system_prompts = [msg["content"] for msg in messages if msg["role"] == "system"]
 
         data = {
             "contents": gemini_messages,
-            "generationConfig": {"temperature": 0.7, "maxOutputTokens": 4000, **kwargs},
+            "generationConfig": {
+                "temperature": self.temperature,
+                "maxOutputTokens": self.max_tokens,
+                **kwargs,
+            },
         }
+        if system_prompts:
+            data["systemInstruction"] = {
+                "parts": [{"text": "\n\n".join(system_prompts)}]
+            }
 
-        url = f"{self.base_url}/models/{self.model}:generateContent"
+        method = "streamGenerateContent" if stream else "generateContent"
+        url = f"{self.base_url}/models/{self.model}:{method}"
         params = {"key": self.api_key}
+        if stream:
+            params["alt"] = "sse"
+
+        with self._session.post(
+            url,
+            params=params,
+            data=orjson.dumps(data),
+            headers={"Content-Type": "application/json"},
+            timeout=120,
+            stream=stream,
+        ) as response:
+            response.raise_for_status()
+
+            if stream:
+                return _collect_stream(
+                    (_gemini_text(event) for event in _iter_sse_data(response)),
+                    on_progress,
+                )
 
-        response = requests.post(url, params=params, json=data, timeout=120)
-        response.raise_for_status()
-
-        result = response.json()
-        return result["candidates"][0]["content"]["parts"][0]["text"]
+            result = orjson.loads(response.content)
+            return result["candidates"][0]["content"]["parts"][0]["text"]
 
 
 class AIServiceFactory:
@@ -777,14 +1459,35 @@ class AIServiceFactory:
         return list(cls.PROVIDERS.keys())
 
 
+# Default service instances per provider, shared by every task in the process
+# (services keep no per-request state, so one instance can serve them all)
+_default_services: Dict[str, AIServiceBase] = {}
+_default_services_lock = threading.Lock()
+
+
 # Manter compatibilidade com código existente
 def get_default_ai_service() -> AIServiceBase:
     """Get the default AI service (can be configured via settings)"""
-    default_provider = getattr(settings, "DEFAULT_AI_PROVIDER", "openai")
-    logger.info(
-        f"Using AI service provider: {AIServiceFactory.PROVIDERS[default_provider].__name__}"
-    )
-    return AIServiceFactory.create_service(default_provider)
+    default_provider = get_default_ai_provider_name()
+    service = _default_services.get(default_provider)
+    if service is None:
+        with _default_services_lock:
+            service = _default_services.get(default_provider)
+            if service is None:
+                service = AIServiceFactory.create_service(default_provider)
+                logger.info("Using AI service provider: %s", type(service).__name__)
+                _default_services[default_provider] = service
+    return service
+
+
+def get_default_ai_service_class() -> Type[AIServiceBase]:
+    """Get the class of the default AI service without instantiating it"""
+    default_provider = get_default_ai_provider_name()
+    if default_provider not in AIServiceFactory.PROVIDERS:
+        raise ValueError(
+            f"Unsupported provider: {default_provider}. Available: {AIServiceFactory.get_available_providers()}"
+        )
+    return AIServiceFactory.PROVIDERS[default_provider]
 
 
 def get_default_ai_provider_name() -> str:
@@ -0,0 +1,47 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Post, Theme
+
+DASHBOARD_STATS_CACHE_KEY = "dashboard:stats:v1"
+
+# Time of the last change to any post or theme (drives list/detail ETags)
+CONTENT_LAST_MODIFIED_CACHE_KEY = "content:last_modified:v1"
+
+
+def _invalidate_content_caches():
+    cache.delete(DASHBOARD_STATS_CACHE_KEY)
+    cache.set(CONTENT_LAST_MODIFIED_CACHE_KEY, timezone.now(), None)
+
+
+def content_changed():
+    """
+    Records that posts/themes changed: drops the cached dashboard statistics
+    and bumps the last-modified marker.
+
+    Called by the model signals and, explicitly, after QuerySet.update()
+    calls, which bypass them. Inside a transaction the invalidation waits for
+    the commit, so no request can pair the new ETag with the old rows (or
+    cache statistics the rollback would never produce).
+    """
+    transaction.on_commit(_invalidate_content_caches)
+
+
+def get_content_last_modified():
+    """Returns the last-modified marker, starting it now if it is missing"""
+    last_modified = cache.get(CONTENT_LAST_MODIFIED_CACHE_KEY)
+    if last_modified is None:
+        last_modified = timezone.now()
+        if not cache.add(CONTENT_LAST_MODIFIED_CACHE_KEY, last_modified, None):
+            last_modified = cache.get(CONTENT_LAST_MODIFIED_CACHE_KEY, last_modified)
+    return last_modified
+
+
+@receiver([post_save, post_delete], sender=Post)
+@receiver([post_save, post_delete], sender=Theme)
+def invalidate_content_caches(sender, **kwargs):
+    """Invalidates the cached API state whenever a post or theme changes"""
+    content_changed()
@@ -1,13 +1,141 @@
 import logging
+import random
+from datetime import timedelta
 
+import openai
 from celery import shared_task
+from django.db import DatabaseError, IntegrityError, transaction
 from django.utils import timezone
 
 from .models import Post, Theme
-from .services import get_default_ai_service, get_default_ai_provider_name
+from .services import (
+    AIServiceFactory,
+    OpenAIService,
+    get_default_ai_service,
+    get_default_ai_provider_name,
+)
+from .signals import content_changed
 
 logger = logging.getLogger(__name__)
 
+# Tempo máximo em processamento antes de um registro ser considerado preso
+PROCESSING_TIMEOUT = timedelta(minutes=5)
+
+# Campos gravados nas transições de status; updated_at é auto_now e só é
+# atualizado quando listado em update_fields (a varredura de presos depende dele)
+STATUS_FIELDS = ["is_processing", "processing_status", "updated_at"]
+
+# Campos lidos por Post.save() (evitam uma consulta extra por campo adiado)
+POST_SAVE_FIELDS = ["status", "generated_at"]
+
+# Colunas carregadas por cada tarefa de post: só o que a tarefa lê ou grava,
+# sem os TextFields que ela não usa
+IMPROVE_POST_FIELDS = [
+    "title",
+    "content",
+    "post_type",
+    "topic",
+    "generation_prompt",
+    "ai_provider_used",
+    "ai_model_used",
+    *POST_SAVE_FIELDS,
+    *STATUS_FIELDS,
+]
+IMAGE_PROMPT_POST_FIELDS = [
+    "title",
+    "post_type",
+    "topic",
+    "cover_image_prompt",
+    "generation_prompt",
+    "ai_provider_used",
+    "ai_model_used",
+    "theme__title",
+    *POST_SAVE_FIELDS,
+    *STATUS_FIELDS,
+]
+
+# Backoff exponencial entre novas tentativas das tarefas (segundos)
+RETRY_BASE_DELAY = 30
+RETRY_MAX_DELAY = 10 * 60
+
+# Intervalo inicial e máximo entre consultas a um lote do Batch API (segundos)
+BATCH_POLL_INITIAL_DELAY = 60
+BATCH_POLL_MAX_DELAY = 30 * 60
+
+# Falhas da OpenAI que não dizem nada sobre o lote (rede, limite, instabilidade)
+TRANSIENT_OPENAI_ERRORS = (
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+
+def _progress_reporter(task):
+    """
+    on_progress que publica o texto parcial gerado pela IA no estado da
+    tarefa (PROGRESS), de onde os endpoints de status o devolvem em "info"
+    """
+    if not task.request.id:
+        # Executada diretamente, fora de um worker: não há estado para publicar
+        return None
+
+    def report(partial):
+        task.update_state(state="PROGRESS", meta={"partial": partial})
+
+    return report
+
+
+def _timestamp(moment):
+    """Data e hora no formato dd/mm/aaaa hh:mm das notas em generation_prompt"""
+    return (
+        f"{moment.day:02d}/{moment.month:02d}/{moment.year} "
+        f"{moment.hour:02d}:{moment.minute:02d}"
+    )
+
+
+def _retry_countdown(retries):
+    """
+    Espera antes da próxima tentativa: backoff exponencial com jitter total,
+    para que tarefas que falharam juntas não voltem ao provedor ao mesmo tempo
+    """
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**retries))
+
+
+def _mark_failed(model, pk):
+    """
+    Encerra o processamento como falho com um único UPDATE; usado quando nada
+    além do status mudou, então não há por que gravar a instância
+    """
+    model.objects.filter(pk=pk).update(
+        is_processing=False, processing_status="failed", updated_at=timezone.now()
+    )
+    # QuerySet.update() não dispara post_save
+    content_changed()
+
+
+def _mark_processing(model, pk, **fields):
+    """
+    Marca o registro como em processamento com um único UPDATE, sem
+    carregar a instância nem disparar os sinais de save
+    """
+    model.objects.filter(pk=pk).update(
+        processing_status="processing", updated_at=timezone.now(), **fields
+    )
+    # QuerySet.update() não dispara post_save
+    content_changed()
+
+
+def _merged_topics(existing_topics, topics_data):
+    """suggested_topics com os tópicos novos somados aos já existentes"""
+    if not existing_topics:
+        return topics_data
+    combined_topics = existing_topics + topics_data["topics"]
+    return {
+        "topics": combined_topics,
+        "total_count": len(combined_topics),
+        "last_generated": timezone.now().isoformat(),
+    }
+
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
 def generate_topics_task(self, theme_id, user_id=None):
@@ -16,12 +144,12 @@ def generate_topics_task(self, theme_id, user_id=None):
     """
     theme = None
     try:
-        theme = Theme.objects.get(id=theme_id)
+        theme = Theme.objects.only("title", "suggested_topics", *STATUS_FIELDS).get(
+            id=theme_id
+        )
 
         # Update status to processing
-        theme.is_processing = True
-        theme.processing_status = "processing"
-        theme.save()
+        _mark_processing(Theme, theme.pk, is_processing=True)
 
         ai_service = get_default_ai_service()
 
@@ -40,23 +168,20 @@ def generate_topics_task(self, theme_id, user_id=None):
 
         if topics_data.get("topics"):
             # Combine existing topics with new ones
-            if existing_topics:
-                combined_topics = existing_topics + topics_data["topics"]
-                combined_data = {
-                    "topics": combined_topics,
-                    "total_count": len(combined_topics),
-                    "last_generated": timezone.now().isoformat(),
-                }
-                new_topics_count = len(topics_data["topics"])
-            else:
-                combined_data = topics_data
-                new_topics_count = len(topics_data["topics"])
+            combined_data = _merged_topics(existing_topics, topics_data)
+            new_topics_count = len(topics_data["topics"])
 
             theme.suggested_topics = combined_data
             theme.topics_generated_at = timezone.now()
             theme.processing_status = "completed"
             theme.is_processing = False  # Important: mark as not processing
-            theme.save()
+            theme.save(
+                update_fields=[
+                    "suggested_topics",
+                    "topics_generated_at",
+                    *STATUS_FIELDS,
+                ]
+            )
 
             logger.info(
                 f"Topics successfully added to theme {theme.title}. Total: {len(combined_data['topics'])}"
@@ -68,9 +193,7 @@ def generate_topics_task(self, theme_id, user_id=None):
                 "new_topics_count": new_topics_count,
             }
         else:
-            theme.processing_status = "failed"
-            theme.is_processing = False  # Important: mark as not processing
-            theme.save()
+            _mark_failed(Theme, theme.pk)
 
             logger.error(f"Failed to generate topics for theme {theme.title}")
             return {
@@ -89,27 +212,230 @@ def generate_topics_task(self, theme_id, user_id=None):
             try:
                 theme.is_processing = False
                 theme.processing_status = "failed"
-                theme.save()
-            except:
-                pass
+                theme.save(update_fields=STATUS_FIELDS)
+            except DatabaseError as db_error:
+                logger.warning(
+                    f"Não foi possível marcar o tema {theme_id} como falho: {db_error}"
+                )
 
         # Tentar novamente em caso de erro
         if self.request.retries < self.max_retries:
             logger.info(f"Tentativa {self.request.retries + 1} de {self.max_retries}")
-            raise self.retry(countdown=60 * (self.request.retries + 1))
+            raise self.retry(countdown=_retry_countdown(self.request.retries))
 
         # Atualizar status de falha após esgotar tentativas
         try:
-            theme = Theme.objects.get(id=theme_id)
+            theme = Theme.objects.only(*STATUS_FIELDS).get(id=theme_id)
             theme.processing_status = "failed"
             theme.is_processing = False  # Importante: marcar como não processando
-            theme.save()
-        except:
-            pass
+            theme.save(update_fields=STATUS_FIELDS)
+        except (Theme.DoesNotExist, DatabaseError) as db_error:
+            logger.warning(
+                f"Não foi possível marcar o tema {theme_id} como falho: {db_error}"
+            )
 
         return {"status": "error", "message": f"Erro ao gerar tópicos: {str(e)}"}
 
 
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def generate_topics_batch_task(self, theme_ids):
+    """
+    Gera tópicos para vários temas com uma única chamada à IA.
+
+    Os temas chegam já marcados como em processamento (bulk_generate_topics);
+    cada um termina como completed, ou failed se a resposta não trouxe
+    tópicos para ele.
+    """
+    generated = False
+    try:
+        themes = list(
+            Theme.objects.filter(id__in=theme_ids).only(
+                "title", "suggested_topics", *STATUS_FIELDS
+            )
+        )
+        if not themes:
+            return {"status": "error", "message": "Nenhum tema encontrado"}
+
+        existing = [
+            (theme.suggested_topics or {}).get("topics") or [] for theme in themes
+        ]
+        results = get_default_ai_service().generate_topics_batch(
+            [theme.title for theme in themes], existing
+        )
+        generated = True
+
+        completed_ids = []
+        failed_ids = []
+        now = timezone.now()
+        with transaction.atomic():
+            for theme, existing_topics, topics_data in zip(themes, existing, results):
+                if not topics_data["topics"]:
+                    failed_ids.append(theme.id)
+                    continue
+                theme.suggested_topics = _merged_topics(existing_topics, topics_data)
+                theme.topics_generated_at = now
+                theme.processing_status = "completed"
+                theme.is_processing = False
+                theme.save(
+                    update_fields=[
+                        "suggested_topics",
+                        "topics_generated_at",
+                        *STATUS_FIELDS,
+                    ]
+                )
+                completed_ids.append(theme.id)
+
+        if failed_ids:
+            logger.error(f"A IA não gerou tópicos para os temas {failed_ids}")
+            Theme.objects.filter(id__in=failed_ids).update(
+                is_processing=False,
+                processing_status="failed",
+                updated_at=timezone.now(),
+            )
+            # QuerySet.update() não dispara post_save
+            content_changed()
+
+        logger.info(
+            f"Tópicos gerados em lote: {len(completed_ids)} temas concluídos, {len(failed_ids)} falharam"
+        )
+        return {
+            "status": "success" if completed_ids else "error",
+            "message": f"Topics generated for {len(completed_ids)} of {len(themes)} themes.",
+            "completed_theme_ids": completed_ids,
+            "failed_theme_ids": failed_ids,
+        }
+
+    except Exception as e:
+        logger.error(f"Erro ao gerar tópicos em lote: {str(e)}")
+
+        # Depois da chamada à IA uma nova tentativa pagaria a geração de novo
+        if not generated and self.request.retries < self.max_retries:
+            logger.info(f"Tentativa {self.request.retries + 1} de {self.max_retries}")
+            raise self.retry(countdown=_retry_countdown(self.request.retries))
+
+        # Encerrar como falhos os temas que continuam em processamento
+        try:
+            Theme.objects.filter(id__in=theme_ids, is_processing=True).update(
+                is_processing=False,
+                processing_status="failed",
+                updated_at=timezone.now(),
+            )
+            content_changed()
+        except DatabaseError as db_error:
+            logger.warning(
+                f"Não foi possível marcar os temas {theme_ids} como falhos: {db_error}"
+            )
+
+        return {
+            "status": "error",
+            "message": f"Erro ao gerar tópicos em lote: {str(e)}",
+        }
+
+
+def _generated_post_fields(
+    theme, topic, post_type, content_data, ai_service, ai_provider_name
+):
+    """Campos de um Post criado a partir do conteúdo gerado pela IA"""
+    post_data = {
+        "theme": theme,
+        "post_type": post_type,
+        "title": content_data.get("title", f"Post sobre {topic}"),
+        "content": content_data.get("content", ""),
+        "topic": topic,
+        "seo_title": content_data.get("seo_title", topic[:60]),
+        "seo_description": content_data.get("seo_description", ""),
+        "status": "generated",
+        "generated_at": timezone.now(),
+        "generation_prompt": f"Tópico: {topic}, Tipo: {post_type}",
+        "ai_model_used": getattr(
+            ai_service,
+            "model",
+            "gpt-4o" if post_type == "article" else "gpt-4o-mini",
+        ),
+        "ai_provider_used": ai_provider_name,
+    }
+
+    # Para artigos, adicionar o post promocional se disponível
+    if post_type == "article" and content_data.get("promotional_post"):
+        post_data["promotional_post"] = content_data.get("promotional_post")
+
+    return post_data
+
+
+def _topic_title(topic):
+    """Título de um tópico salvo em suggested_topics (dict) ou informado como texto"""
+    return topic.get("title", "") if isinstance(topic, dict) else topic
+
+
+def _create_generated_posts(theme, topics, post_type, contents, ai_service):
+    """
+    Cria os posts gerados em lote, num único INSERT, e devolve os ids criados.
+
+    Tópicos repetidos contam uma vez e os que já têm post deste tipo são
+    ignorados: outra geração pode ter criado o post enquanto o lote rodava, e
+    a constraint única não pode descartar o lote inteiro por causa dele.
+    """
+    ai_provider_name = get_default_ai_provider_name()
+    by_title = {}
+    for topic, content_data in zip(topics, contents):
+        by_title.setdefault(_topic_title(topic), content_data)
+    existing = set(
+        Post.objects.filter(
+            theme=theme, post_type=post_type, topic__in=list(by_title)
+        ).values_list("topic", flat=True)
+    )
+
+    posts = []
+    for title, content_data in by_title.items():
+        if title in existing:
+            continue
+        post = Post(
+            **_generated_post_fields(
+                theme,
+                title,
+                post_type,
+                content_data,
+                ai_service,
+                ai_provider_name,
+            )
+        )
+        # bulk_create não passa por Post.save()
+        post.content_length = len(post.content or "")
+        posts.append(post)
+    if not posts:
+        return []
+
+    # ignore_conflicts cobre o post criado entre a consulta acima e o INSERT
+    Post.objects.bulk_create(posts, batch_size=100, ignore_conflicts=True)
+    # bulk_create também não dispara post_save
+    content_changed()
+    # Com ignore_conflicts o bulk_create não preenche os ids
+    return list(
+        Post.objects.filter(
+            theme=theme,
+            post_type=post_type,
+            topic__in=[post.topic for post in posts],
+        ).values_list("id", flat=True)
+    )
+
+
+def _existing_post_id(theme, post_type, topic):
+    return (
+        Post.objects.filter(theme=theme, post_type=post_type, topic=topic)
+        .values_list("id", flat=True)
+        .first()
+    )
+
+
+def _duplicate_post_warning(post_type, post_id):
+    post_type_display = dict(Post.POST_TYPES).get(post_type, post_type)
+    return {
+        "status": "warning",
+        "message": f"Já existe um {post_type_display.lower()} para este tópico.",
+        "post_id": post_id,
+    }
+
+
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
 def generate_post_content_task(
     self, theme_id, topic, post_type, topic_data=None, user_id=None
@@ -118,18 +444,12 @@ def generate_post_content_task(
     Tarefa assíncrona para gerar conteúdo de post usando OpenAI
     """
     try:
-        theme = Theme.objects.get(id=theme_id)
+        theme = Theme.objects.only("id", "title").get(id=theme_id)
 
         # Verificar se já existe um post deste tipo para este tema
-        existing_post = Post.objects.filter(
-            theme=theme, post_type=post_type, topic=topic
-        ).first()
-        if existing_post:
-            return {
-                "status": "warning",
-                "message": f"Já existe um {existing_post.get_post_type_display().lower()} para este tópico.",
-                "post_id": existing_post.id,
-            }
+        existing_post_id = _existing_post_id(theme, post_type, topic)
+        if existing_post_id:
+            return _duplicate_post_warning(post_type, existing_post_id)
 
         ai_service = get_default_ai_service()
         ai_provider_name = get_default_ai_provider_name()
@@ -137,34 +457,31 @@ def generate_post_content_task(
             f"Gerando conteúdo para tema '{theme.title}', tópico '{topic}', tipo '{post_type}', através do provedor '{ai_provider_name}'"
         )
         content_data = ai_service.generate_post_content(
-            topic, post_type, theme.title, topic_data
+            topic,
+            post_type,
+            theme.title,
+            topic_data,
+            on_progress=_progress_reporter(self),
         )
 
-        # Criar o post
-        post_data = {
-            "theme": theme,
-            "post_type": post_type,
-            "title": content_data.get("title", f"Post sobre {topic}"),
-            "content": content_data.get("content", ""),
-            "topic": topic,
-            "seo_title": content_data.get("seo_title", topic[:60]),
-            "seo_description": content_data.get("seo_description", ""),
-            "status": "generated",
-            "generated_at": timezone.now(),
-            "generation_prompt": f"Tópico: {topic}, Tipo: {post_type}",
-            "ai_model_used": getattr(
-                ai_service,
-                "model",
-                "gpt-4o" if post_type == "article" else "gpt-4o-mini",
-            ),
-            "ai_provider_used": ai_provider_name,
-        }
-
-        # Para artigos, adicionar o post promocional se disponível
-        if post_type == "article" and content_data.get("promotional_post"):
-            post_data["promotional_post"] = content_data.get("promotional_post")
-
-        post = Post.objects.create(**post_data)
+        # Criar o post; outra tarefa pode ter criado o mesmo post durante a
+        # geração, e a constraint única é quem garante que não haja duplicado
+        try:
+            with transaction.atomic():
+                post = Post.objects.create(
+                    **_generated_post_fields(
+                        theme,
+                        topic,
+                        post_type,
+                        content_data,
+                        ai_service,
+                        ai_provider_name,
+                    )
+                )
+        except IntegrityError:
+            return _duplicate_post_warning(
+                post_type, _existing_post_id(theme, post_type, topic)
+            )
 
         logger.info(f"Post gerado com sucesso: {post.title}")
         return {
@@ -183,22 +500,171 @@ def generate_post_content_task(
         # Tentar novamente em caso de erro
         if self.request.retries < self.max_retries:
             logger.info(f"Tentativa {self.request.retries + 1} de {self.max_retries}")
-            raise self.retry(countdown=60 * (self.request.retries + 1))
+            raise self.retry(countdown=_retry_countdown(self.request.retries))
 
         return {"status": "error", "message": f"Erro ao gerar post: {str(e)}"}
 
 
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def generate_posts_batch_task(self, theme_id, topics, post_type="simple"):
+    """
+    Tarefa assíncrona para gerar vários posts de um tema de uma só vez.
+
+    Com a OpenAI os pedidos vão para o Batch API (metade do custo) e
+    poll_posts_batch_task cria os posts quando o lote termina; os demais
+    provedores geram os posts em paralelo nesta mesma tarefa.
+    """
+    generated = False
+    try:
+        theme = Theme.objects.only("id", "title").get(id=theme_id)
+
+        # Um pedido por tópico, ignorando os que já têm um post deste tipo
+        by_title = {}
+        for topic in topics:
+            by_title.setdefault(_topic_title(topic), topic)
+        existing_topics = set(
+            Post.objects.filter(
+                theme_id=theme_id, post_type=post_type, topic__in=list(by_title)
+            ).values_list("topic", flat=True)
+        )
+        pending = [
+            topic
+            for title, topic in by_title.items()
+            if title and title not in existing_topics
+        ]
+        if not pending:
+            return {
+                "status": "warning",
+                "message": "Todos os tópicos já têm posts deste tipo.",
+            }
+
+        ai_service = get_default_ai_service()
+
+        if not isinstance(ai_service, OpenAIService):
+            contents = ai_service.generate_posts_bulk(pending, post_type, theme.title)
+            generated = True
+            post_ids = _create_generated_posts(
+                theme, pending, post_type, contents, ai_service
+            )
+            logger.info(f"{len(post_ids)} posts gerados para o tema {theme.title}")
+            return {
+                "status": "success",
+                "message": f"{len(post_ids)} posts gerados com sucesso!",
+                "post_ids": post_ids,
+            }
+
+        requests_by_id = {
+            str(index): ai_service.build_post_content_messages(
+                _topic_title(topic),
+                post_type,
+                theme.title,
+                topic if isinstance(topic, dict) else None,
+            )
+            for index, topic in enumerate(pending)
+        }
+        batch_id = ai_service.submit_batch(requests_by_id)
+        generated = True
+        logger.info(
+            f"Lote {batch_id} enviado ao Batch API com {len(pending)} posts do tema {theme.title}"
+        )
+
+        poll_posts_batch_task.apply_async(
+            (batch_id, theme_id, pending, post_type),
+            countdown=BATCH_POLL_INITIAL_DELAY,
+        )
+        return {
+            "status": "queued",
+            "message": f"{len(pending)} posts enviados para geração em lote.",
+            "batch_id": batch_id,
+        }
+
+    except Theme.DoesNotExist:
+        logger.error(f"Tema com ID {theme_id} não encontrado")
+        return {"status": "error", "message": "Tema não encontrado"}
+    except Exception as e:
+        logger.error(f"Erro ao gerar posts em lote: {str(e)}")
+
+        # Depois da geração (ou do envio do lote) uma nova tentativa pagaria
+        # todos os posts de novo
+        if not generated and self.request.retries < self.max_retries:
+            logger.info(f"Tentativa {self.request.retries + 1} de {self.max_retries}")
+            raise self.retry(countdown=_retry_countdown(self.request.retries))
+
+        return {"status": "error", "message": f"Erro ao gerar posts em lote: {str(e)}"}
+
+
+@shared_task(bind=True, max_retries=100)
+def poll_posts_batch_task(self, batch_id, theme_id, topics, post_type):
+    """
+    Consulta um lote do Batch API e cria os posts quando ele termina.
+
+    Enquanto o lote estiver em andamento a tarefa se reagenda com intervalo
+    crescente (até BATCH_POLL_MAX_DELAY), sem ocupar um worker na espera.
+    """
+    countdown = min(
+        BATCH_POLL_INITIAL_DELAY * 2**self.request.retries, BATCH_POLL_MAX_DELAY
+    )
+    ai_service = AIServiceFactory.create_service("openai")
+    try:
+        results = ai_service.get_batch_results(batch_id)
+    except RuntimeError as e:
+        logger.error(str(e))
+        return {"status": "error", "message": str(e), "batch_id": batch_id}
+    except TRANSIENT_OPENAI_ERRORS as e:
+        # O lote continua na OpenAI: uma falha de rede não o dá por perdido
+        logger.warning(f"Falha temporária ao consultar o lote {batch_id}: {e}")
+        raise self.retry(countdown=countdown)
+
+    if results is None:
+        raise self.retry(countdown=countdown)
+
+    try:
+        theme = Theme.objects.only("id", "title").get(id=theme_id)
+    except Theme.DoesNotExist:
+        logger.error(f"Tema com ID {theme_id} não encontrado")
+        return {"status": "error", "message": "Tema não encontrado"}
+
+    contents = []
+    for index, topic in enumerate(topics):
+        try:
+            content_data = ai_service.parse_post_content(
+                results.get(str(index)), _topic_title(topic)
+            )
+            if not isinstance(content_data, dict):
+                raise ValueError("a resposta não é um objeto JSON")
+            contents.append(content_data)
+        except ValueError as e:
+            logger.error(f"Resposta inválida no lote {batch_id} ({index}): {e}")
+            contents.append(ai_service._fallback_post_content(_topic_title(topic)))
+
+    try:
+        post_ids = _create_generated_posts(
+            theme, topics, post_type, contents, ai_service
+        )
+    except DatabaseError as e:
+        # Os resultados continuam disponíveis na OpenAI: consultar de novo
+        # não paga a geração outra vez
+        logger.warning(f"Erro ao salvar os posts do lote {batch_id}: {e}")
+        raise self.retry(countdown=_retry_countdown(self.request.retries))
+    logger.info(f"Lote {batch_id} concluído: {len(post_ids)} posts criados")
+    return {
+        "status": "success",
+        "message": f"{len(post_ids)} posts gerados com sucesso!",
+        "batch_id": batch_id,
+        "post_ids": post_ids,
+    }
+
+
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
 def improve_post_content_task(self, post_id, user_id=None):
     """
     Tarefa assíncrona para melhorar conteúdo de post usando OpenAI
     """
     try:
-        post = Post.objects.get(id=post_id)
+        post = Post.objects.only(*IMPROVE_POST_FIELDS).get(id=post_id)
 
         # Atualizar status para processando
-        post.processing_status = "processing"
-        post.save()
+        _mark_processing(Post, post.pk)
 
         ai_service = get_default_ai_service()
         ai_provider_name = get_default_ai_provider_name()
@@ -207,6 +673,7 @@ def improve_post_content_task(self, post_id, user_id=None):
             post_title=post.title,
             post_type=post.post_type,
             topic=post.topic,
+            on_progress=_progress_reporter(self),
         )
 
         if improvement_data.get("improved_content"):
@@ -215,13 +682,15 @@ def improve_post_content_task(self, post_id, user_id=None):
                 # Atualizar o conteúdo do post
                 post.content = improvement_data["improved_content"]
                 post.updated_at = timezone.now()
+                post.is_processing = False  # Importante: marcar como não processando
                 post.processing_status = "completed"
 
                 # Atualizar informações de geração
+                generation_info = f"Melhorado em: {_timestamp(post.updated_at)} via {ai_provider_name}"
                 if post.generation_prompt:
-                    post.generation_prompt += f" | Melhorado em: {timezone.now().strftime('%d/%m/%Y %H:%M')} via {ai_provider_name}"
+                    post.generation_prompt += f" | {generation_info}"
                 else:
-                    post.generation_prompt = f"Melhorado em: {timezone.now().strftime('%d/%m/%Y %H:%M')} via {ai_provider_name}"
+                    post.generation_prompt = generation_info
 
                 # Atualizar informações do modelo AI se não estiverem definidas
                 if not post.ai_provider_used:
@@ -229,7 +698,15 @@ def improve_post_content_task(self, post_id, user_id=None):
                 if not post.ai_model_used:
                     post.ai_model_used = getattr(ai_service, "model", "Unknown")
 
-                post.save()
+                post.save(
+                    update_fields=[
+                        "content",
+                        "generation_prompt",
+                        "ai_provider_used",
+                        "ai_model_used",
+                        *STATUS_FIELDS,
+                    ]
+                )
 
                 improvement_summary = improvement_data.get(
                     "improvement_summary", "Conteúdo melhorado com sucesso!"
@@ -244,8 +721,7 @@ def improve_post_content_task(self, post_id, user_id=None):
                 }
             else:
                 # Conteúdo não foi alterado, mas há um resumo de melhoria (provavelmente um erro)
-                post.processing_status = "failed"
-                post.save()
+                _mark_failed(Post, post.pk)
 
                 error_message = improvement_data.get(
                     "improvement_summary", "O conteúdo não pôde ser melhorado."
@@ -259,8 +735,7 @@ def improve_post_content_task(self, post_id, user_id=None):
                     "post_id": post.id,
                 }
         else:
-            post.processing_status = "failed"
-            post.save()
+            _mark_failed(Post, post.pk)
 
             return {
                 "status": "error",
@@ -276,15 +751,18 @@ def improve_post_content_task(self, post_id, user_id=None):
         # Tentar novamente em caso de erro
         if self.request.retries < self.max_retries:
             logger.info(f"Tentativa {self.request.retries + 1} de {self.max_retries}")
-            raise self.retry(countdown=60 * (self.request.retries + 1))
+            raise self.retry(countdown=_retry_countdown(self.request.retries))
 
         # Atualizar status de falha após esgotar tentativas
         try:
-            post = Post.objects.get(id=post_id)
+            post = Post.objects.only(*POST_SAVE_FIELDS, *STATUS_FIELDS).get(id=post_id)
+            post.is_processing = False
             post.processing_status = "failed"
-            post.save()
-        except:
-            pass
+            post.save(update_fields=STATUS_FIELDS)
+        except (Post.DoesNotExist, DatabaseError) as db_error:
+            logger.warning(
+                f"Não foi possível marcar o post {post_id} como falho: {db_error}"
+            )
 
         return {"status": "error", "message": f"Erro ao melhorar post: {str(e)}"}
 
@@ -295,7 +773,11 @@ def regenerate_image_prompt_task(self, post_id, user_id=None):
     Tarefa assíncrona para regenerar prompt de imagem de capa usando OpenAI
     """
     try:
-        post = Post.objects.get(id=post_id)
+        post = (
+            Post.objects.select_related("theme")
+            .only(*IMAGE_PROMPT_POST_FIELDS)
+            .get(id=post_id)
+        )
 
         # Verificar se é um artigo
         if post.post_type != "article":
@@ -305,9 +787,7 @@ def regenerate_image_prompt_task(self, post_id, user_id=None):
             }
 
         # Atualizar status para processando
-        post.is_processing = True
-        post.processing_status = "processing"
-        post.save()
+        _mark_processing(Post, post.pk, is_processing=True)
 
         # Determinar se é geração inicial ou regeneração
         is_first_generation = not post.cover_image_prompt
@@ -330,7 +810,7 @@ def regenerate_image_prompt_task(self, post_id, user_id=None):
             post.processing_status = "completed"
 
             # Atualizar informações de geração
-            timestamp = timezone.now().strftime("%d/%m/%Y %H:%M")
+            timestamp = _timestamp(post.updated_at)
             if is_first_generation:
                 generation_info = (
                     f"Imagem gerada em: {timestamp} via {ai_provider_name}"
@@ -351,7 +831,15 @@ def regenerate_image_prompt_task(self, post_id, user_id=None):
             if not post.ai_model_used:
                 post.ai_model_used = getattr(ai_service, "model", "Unknown")
 
-            post.save()
+            post.save(
+                update_fields=[
+                    "cover_image_prompt",
+                    "generation_prompt",
+                    "ai_provider_used",
+                    "ai_model_used",
+                    *STATUS_FIELDS,
+                ]
+            )
 
             style_notes = image_data.get(
                 "style_notes", f"Prompt da imagem {action_type} com sucesso!"
@@ -366,9 +854,7 @@ def regenerate_image_prompt_task(self, post_id, user_id=None):
                 "style_notes": style_notes,
             }
         else:
-            post.is_processing = False
-            post.processing_status = "failed"
-            post.save()
+            _mark_failed(Post, post.pk)
 
             return {
                 "status": "error",
@@ -384,18 +870,49 @@ def regenerate_image_prompt_task(self, post_id, user_id=None):
         # Tentar novamente em caso de erro
         if self.request.retries < self.max_retries:
             logger.info(f"Tentativa {self.request.retries + 1} de {self.max_retries}")
-            raise self.retry(countdown=60 * (self.request.retries + 1))
+            raise self.retry(countdown=_retry_countdown(self.request.retries))
 
         # Atualizar status de falha após esgotar tentativas
         try:
-            post = Post.objects.get(id=post_id)
+            post = Post.objects.only(*POST_SAVE_FIELDS, *STATUS_FIELDS).get(id=post_id)
             post.is_processing = False
             post.processing_status = "failed"
-            post.save()
-        except Exception:
-            pass
+            post.save(update_fields=STATUS_FIELDS)
+        except (Post.DoesNotExist, DatabaseError) as db_error:
+            logger.warning(
+                f"Não foi possível marcar o post {post_id} como falho: {db_error}"
+            )
 
         return {
             "status": "error",
             "message": f"Erro ao regenerar prompt da imagem: {str(e)}",
         }
+
+
+@shared_task
+def sweep_stale_processing():
+    """
+    Tarefa periódica (Celery beat) que libera temas e posts presos em processamento
+    """
+    # Um UPDATE em lote por tabela, em vez de checar a cada consulta de status
+    now = timezone.now()
+    stale = {
+        "is_processing": True,
+        "updated_at__lt": now - PROCESSING_TIMEOUT,
+    }
+    cleared = {
+        "is_processing": False,
+        "processing_status": "timeout",
+        "updated_at": now,
+    }
+    themes_count = Theme.objects.filter(**stale).update(**cleared)
+    posts_count = Post.objects.filter(**stale).update(**cleared)
+
+    if themes_count or posts_count:
+        # update() não dispara sinais: invalidar os caches da API manualmente
+        content_changed()
+        logger.warning(
+            f"Liberados {themes_count} temas e {posts_count} posts presos em processamento"
+        )
+
+    return {"themes": themes_count, "posts": posts_count}
@@ -1,67 +1,86 @@
+from collections import namedtuple
+from functools import lru_cache
+
 from django import template
 import re
 
 register = template.Library()
 
+_SENTENCE_END_RE = re.compile(r"[.!?]+")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+
+ContentStats = namedtuple("ContentStats", ["words", "sentences", "paragraphs", "chars"])
+
+
+@lru_cache(maxsize=512)
+def _content_stats(text):
+    """Calcula de uma só vez as métricas usadas pelos filtros abaixo"""
+    stripped = text.strip()
+
+    # Sentenças terminadas com ., !, ?; os trechos só com espaços são
+    # descartados, então não é preciso normalizar os espaços antes
+    sentences = sum(1 for s in _SENTENCE_END_RE.split(stripped) if s.strip())
+
+    # Sem quebra de linha o texto inteiro é um único parágrafo
+    if "\n" not in stripped:
+        paragraphs = 1 if stripped else 0
+    else:
+        paragraphs = sum(1 for p in _PARAGRAPH_BREAK_RE.split(stripped) if p.strip())
+
+    return ContentStats(len(text.split()), sentences, paragraphs, len(text))
+
+
+def _stats(value):
+    # Vários filtros leem o mesmo texto na mesma página; o cache evita
+    # reprocessá-lo a cada filtro
+    return _content_stats(str(value))
+
+
 @register.filter
 def sentence_count(value):
     """Conta o número de sentenças no texto"""
     if not value:
         return 0
-    
-    # Remove espaços extras e quebras de linha
-    text = re.sub(r'\s+', ' ', value.strip())
-    
-    # Conta sentenças terminadas com ., !, ?
-    sentences = re.split(r'[.!?]+', text)
-    
-    # Remove strings vazias
-    sentences = [s.strip() for s in sentences if s.strip()]
-    
-    return len(sentences)
+
+    return _stats(value).sentences
+
 
 @register.filter
 def paragraph_count(value):
     """Conta o número de parágrafos no texto"""
     if not value:
         return 0
-    
-    # Divide por quebras de linha duplas (parágrafos)
-    paragraphs = re.split(r'\n\s*\n', value.strip())
-    
-    # Remove strings vazias
-    paragraphs = [p.strip() for p in paragraphs if p.strip()]
-    
-    return len(paragraphs)
+
+    return _stats(value).paragraphs
+
 
 @register.filter
 def words_per_sentence(value):
     """Calcula a média de palavras por sentença"""
     if not value:
         return 0
-    
-    word_count = len(value.split())
-    sentence_count_val = sentence_count(value)
-    
-    if sentence_count_val == 0:
+
+    stats = _stats(value)
+
+    if stats.sentences == 0:
         return 0
-    
-    return round(word_count / sentence_count_val, 1)
+
+    return round(stats.words / stats.sentences, 1)
+
 
 @register.filter
 def reading_difficulty(value):
     """Avalia a dificuldade de leitura baseada em métricas simples"""
     if not value:
         return "Indefinido"
-    
-    words = len(value.split())
-    sentences = sentence_count(value)
-    
-    if sentences == 0:
+
+    stats = _stats(value)
+
+    if stats.sentences == 0:
         return "Indefinido"
-    
-    avg_words_per_sentence = words / sentences
-    
+
+    avg_words_per_sentence = stats.words / stats.sentences
+
     if avg_words_per_sentence <= 15:
         return "Fácil"
     elif avg_words_per_sentence <= 20:
@@ -69,16 +88,16 @@ def reading_difficulty(value):
     else:
         return "Difícil"
 
+
 @register.filter
 def content_density(value):
     """Calcula a densidade do conteúdo (palavras por 1000 caracteres)"""
     if not value:
         return 0
-    
-    words = len(value.split())
-    chars = len(value)
-    
-    if chars == 0:
+
+    stats = _stats(value)
+
+    if stats.chars == 0:
         return 0
-    
-    return round((words / chars) * 1000, 1)
+
+    return round((stats.words / stats.chars) * 1000, 1)
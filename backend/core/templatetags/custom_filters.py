@@ -1,8 +1,47 @@
+import hashlib
+import threading
+
 from django import template
+from django.core.cache import cache
 import markdown
 
 register = template.Library()
 
+# Configurar extensões do markdown
+MARKDOWN_EXTENSIONS = [
+    "markdown.extensions.fenced_code",
+    "markdown.extensions.codehilite",
+    "markdown.extensions.tables",
+    "markdown.extensions.toc",
+    "markdown.extensions.nl2br",
+    "markdown.extensions.sane_lists",
+]
+
+# Configurações para destacar código
+MARKDOWN_EXTENSION_CONFIGS = {
+    "markdown.extensions.codehilite": {
+        "css_class": "highlight",
+        "use_pygments": False,  # Use CSS highlighting
+    }
+}
+
+MARKDOWN_CACHE_TTL = 60 * 60 * 24
+
+# Uma instância de Markdown por thread: criá-la é caro, mas ela guarda
+# estado durante a conversão e não pode ser compartilhada entre threads
+_local = threading.local()
+
+
+def _markdown():
+    md = getattr(_local, "md", None)
+    if md is None:
+        md = _local.md = markdown.Markdown(
+            extensions=MARKDOWN_EXTENSIONS,
+            extension_configs=MARKDOWN_EXTENSION_CONFIGS,
+        )
+    return md
+
+
 @register.filter
 def markdown_to_html(value):
     """
@@ -10,29 +49,16 @@ def markdown_to_html(value):
     """
     if not value:
         return ""
-    
-    # Configurar extensões do markdown
-    extensions = [
-        'markdown.extensions.fenced_code',
-        'markdown.extensions.codehilite',
-        'markdown.extensions.tables',
-        'markdown.extensions.toc',
-        'markdown.extensions.nl2br',
-        'markdown.extensions.sane_lists'
-    ]
-    
-    # Configurações para destacar código
-    extension_configs = {
-        'markdown.extensions.codehilite': {
-            'css_class': 'highlight',
-            'use_pygments': False,  # Use CSS highlighting
-        }
-    }
-    
-    # Converter markdown para HTML
-    md = markdown.Markdown(
-        extensions=extensions,
-        extension_configs=extension_configs
-    )
-    
-    return md.convert(value)
+
+    # O mesmo conteúdo é renderizado várias vezes; a chave é o hash do texto,
+    # então uma edição gera uma chave nova e não há o que invalidar
+    key = "md:" + hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+    html = cache.get(key)
+    if html is None:
+        # Converter markdown para HTML
+        md = _markdown()
+        md.reset()
+        html = md.convert(value)
+        cache.set(key, html, MARKDOWN_CACHE_TTL)
+
+    return html
@@ -31,11 +31,27 @@ app.conf.update(
     # Configurações de retry
     task_acks_late=True,
     worker_prefetch_multiplier=1,
+    # task_reject_on_worker_lost fica desligado: se o worker morrer no meio de
+    # uma tarefa (OOM, kill), a mensagem é confirmada como falha em vez de
+    # voltar para a fila. Reenviar pagaria de novo todas as chamadas à IA em
+    # andamento (no worker gevent, dezenas de uma vez) e uma tarefa que derruba
+    # o worker voltaria para sempre; os registros presos ficam com
+    # sweep_stale_processing
+    # Nenhuma tarefa define rate_limit (o limite de chamadas à IA fica nos
+    # serviços), então o worker não precisa manter esse controle
+    worker_disable_rate_limits=True,
     
     # Configurações de roteamento
+    # As tarefas de IA passam quase todo o tempo esperando a resposta do
+    # provedor, então vão para a fila ai_tasks, atendida por um worker gevent
+    # com alta concorrência (scripts/start_ai_worker.sh); o resto fica na
+    # fila default, no pool prefork
     task_routes={
         'core.tasks.generate_topics_task': {'queue': 'ai_tasks'},
+        'core.tasks.generate_topics_batch_task': {'queue': 'ai_tasks'},
         'core.tasks.generate_post_content_task': {'queue': 'ai_tasks'},
+        'core.tasks.generate_posts_batch_task': {'queue': 'ai_tasks'},
+        'core.tasks.poll_posts_batch_task': {'queue': 'ai_tasks'},
         'core.tasks.improve_post_content_task': {'queue': 'ai_tasks'},
         'core.tasks.regenerate_image_prompt_task': {'queue': 'ai_tasks'},
     },
@@ -30,6 +30,12 @@ SECRET_KEY = "django-insecure-987r#w0ug5!5yvbcx3pb9$p^b35^ajqp$+_uav739hu$cvawdi
 DEBUG = True
 ALLOWED_HOSTS = []
 
+# Build the OpenAPI schema metadata and serve the docs (off in production
+# unless explicitly enabled, see core/schema.py)
+GENERATE_OPENAPI_SCHEMA = os.getenv(
+    "GENERATE_OPENAPI_SCHEMA", str(DEBUG)
+).lower() in ("1", "true", "yes")
+
 
 # Application definition
 
@@ -41,13 +47,15 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "rest_framework",
-    "drf_spectacular",
-    "drf_spectacular_sidecar",
     "corsheaders",
     "django_celery_beat",
     "core",
 ]
 
+# Only load drf-spectacular when the schema/docs are actually served
+if GENERATE_OPENAPI_SCHEMA:
+    INSTALLED_APPS += ["drf_spectacular", "drf_spectacular_sidecar"]
+
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -86,6 +94,12 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Reuse connections across requests instead of reconnecting every time
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
+        # No per-request transaction: reads skip BEGIN/COMMIT and the few
+        # multi-statement writes use transaction.atomic() explicitly
+        "ATOMIC_REQUESTS": False,
     }
 }
 
@@ -129,6 +143,14 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Cache Configuration (Redis)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("REDIS_CACHE_URL", "redis://localhost:6379/1"),
+    }
+}
+
 # Celery Configuration
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")
@@ -149,13 +171,16 @@ CELERY_TASK_TIME_LIMIT = 600  # 10 minutos
 # Configurações do django-celery-beat
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 
-# Configurações de filas específicas
-CELERY_TASK_ROUTES = {
-    "core.tasks.generate_topics_async": {"queue": "ai_tasks"},
-    "core.tasks.generate_post_content_async": {"queue": "ai_tasks"},
-    "core.tasks.improve_post_content_async": {"queue": "ai_tasks"},
+# Tarefas periódicas (sincronizadas com o banco pelo DatabaseScheduler)
+CELERY_BEAT_SCHEDULE = {
+    "sweep-stale-processing": {
+        "task": "core.tasks.sweep_stale_processing",
+        "schedule": 60.0,  # a cada minuto
+    },
 }
 
+# As rotas das filas ficam em post_pilot/celery.py (task_routes)
+
 # Configurações de logging do Celery
 CELERY_WORKER_HIJACK_ROOT_LOGGER = False
 CELERY_WORKER_LOG_FORMAT = "[%(asctime)s: %(levelname)s/%(processName)s] %(message)s"
@@ -181,6 +206,19 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 DEFAULT_AI_PROVIDER = "gemini"
 # DEFAULT_AI_PROVIDER = "openai"
 
+# Client-side rate limits per provider (0 disables the limiter).
+# Set them a little below the account's RPM/TPM quota so bursts from the
+# Celery workers wait locally instead of hitting 429s.
+AI_RPM = int(os.getenv("AI_RPM", "0"))
+AI_TPM = int(os.getenv("AI_TPM", "0"))
+
+# Maximum provider requests in flight at once per worker process (0 = no cap);
+# matters with the gevent AI worker, which runs many tasks concurrently
+AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "0"))
+
+# Seconds to reuse the answer to an identical AI request (0 disables it)
+AI_CACHE_TTL = int(os.getenv("AI_CACHE_TTL", "0"))
+
 # ==============================
 # DJANGO REST FRAMEWORK CONFIGURATION
 # ==============================
@@ -192,16 +230,18 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "core.renderers.ORJSONRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
         "rest_framework.parsers.JSONParser",
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
     ],
-    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+if GENERATE_OPENAPI_SCHEMA:
+    REST_FRAMEWORK["DEFAULT_SCHEMA_CLASS"] = "drf_spectacular.openapi.AutoSchema"
+
 # ==============================
 # DRF SPECTACULAR CONFIGURATION (SWAGGER)
 # ==============================
@@ -22,24 +22,30 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     # path("", include("core.urls")),  # URLs tradicionais do Django (para admin/debug)
     path("", include("core.api_urls")),  # URLs da API REST
-    # Swagger/OpenAPI URLs
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path(
-        "api/docs/",
-        SpectacularSwaggerView.as_view(url_name="schema"),
-        name="swagger-ui",
-    ),
-    path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
 ]
+
+if settings.GENERATE_OPENAPI_SCHEMA:
+    from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
+
+    from core.schema_views import CachedSpectacularAPIView
+
+    # Swagger/OpenAPI URLs
+    urlpatterns += [
+        path("api/schema/", CachedSpectacularAPIView.as_view(), name="schema"),
+        path(
+            "api/docs/",
+            SpectacularSwaggerView.as_view(url_name="schema"),
+            name="swagger-ui",
+        ),
+        path(
+            "api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"
+        ),
+    ]
@@ -0,0 +1,30 @@
+#!/bin/bash
+
+# Script para iniciar o worker das tarefas de IA (fila ai_tasks)
+echo "Iniciando Celery Worker de IA..."
+
+cd "$(dirname "$0")/.."
+
+# Ativar ambiente virtual se existir
+if [ -d ".venv" ]; then
+    source .venv/bin/activate
+    echo "Ambiente virtual ativado"
+fi
+
+CONCURRENCY="${AI_WORKER_CONCURRENCY:-100}"
+
+# No SQLite a espera por um banco travado dorme em C e bloqueia o hub do gevent
+# inteiro: com muitas greenlets gravando ao mesmo tempo o processo congela até
+# "database is locked". Enquanto o banco for SQLite a concorrência fica limitada
+SQLITE_MAX_CONCURRENCY=4
+DB_VENDOR=$(python manage.py shell -v 0 -c "from django.db import connection; print(connection.vendor)")
+if [ "$DB_VENDOR" = "sqlite" ] && [ "$CONCURRENCY" -gt "$SQLITE_MAX_CONCURRENCY" ]; then
+    echo "Banco SQLite: concorrência limitada a $SQLITE_MAX_CONCURRENCY (pedida: $CONCURRENCY)"
+    CONCURRENCY=$SQLITE_MAX_CONCURRENCY
+fi
+
+# As tarefas de IA passam quase todo o tempo esperando o provedor, então usam
+# o pool gevent (o Celery aplica o monkey patching ao iniciar com -P gevent)
+celery -A post_pilot worker --loglevel=info --pool=gevent \
+    --concurrency="$CONCURRENCY" --queues=ai_tasks \
+    --hostname=ai@%h
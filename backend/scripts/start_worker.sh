@@ -11,5 +11,6 @@ if [ -d ".venv" ]; then
     echo "Ambiente virtual ativado"
 fi
 
-# Iniciar worker do Celery
-celery -A post_pilot worker --loglevel=info --concurrency=2 --queues=default,ai_tasks
+# Iniciar worker do Celery (fila default; as tarefas de IA ficam com
+# scripts/start_ai_worker.sh)
+celery -A post_pilot worker --loglevel=info --concurrency=2 --queues=default
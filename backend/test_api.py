@@ -12,6 +12,8 @@ from datetime import datetime
 # Configurações
 BASE_URL = "http://localhost:8000/api"
 HEADERS = {"Content-Type": "application/json"}
+# Limite do parâmetro wait de /tasks/check/ (TASK_CHECK_MAX_WAIT no servidor)
+TASK_CHECK_MAX_WAIT = 30
 
 
 def print_response(response, title="Response"):
@@ -32,7 +34,14 @@ def wait_for_task(task_id, max_wait=60):
     start_time = time.time()
 
     while time.time() - start_time < max_wait:
-        response = requests.get(f"{BASE_URL}/tasks/check/", params={"task_id": task_id})
+        # Long-poll: o servidor segura a requisição até a task terminar (ou o
+        # wait expirar), em vez de uma nova requisição a cada 2 segundos
+        wait = min(max_wait - (time.time() - start_time), TASK_CHECK_MAX_WAIT)
+        response = requests.get(
+            f"{BASE_URL}/tasks/check/",
+            params={"task_id": task_id, "wait": wait},
+            timeout=wait + 10,
+        )
         if response.status_code == 200:
             data = response.json()
             state = data.get("state")
@@ -44,9 +53,7 @@ def wait_for_task(task_id, max_wait=60):
             elif state == "FAILURE":
                 print("❌ Task falhou!")
                 return data
-            elif state in ["PENDING", "STARTED"]:
-                time.sleep(2)
-                continue
+            continue
 
         time.sleep(2)
 
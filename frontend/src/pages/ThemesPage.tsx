@@ -110,7 +110,7 @@ const ThemesPage: React.FC = () => {
         if (theme.is_processing) {
             return <Badge bg="warning">Processando</Badge>;
         }
-        if (theme.suggested_topics && theme.suggested_topics.topics?.length > 0) {
+        if (theme.topics_count > 0) {
             return <Badge bg="success">Tópicos Gerados</Badge>;
         }
         return <Badge bg="secondary">Sem Tópicos</Badge>;
@@ -198,10 +198,10 @@ const ThemesPage: React.FC = () => {
                                         </Col>
                                     </Row>
 
-                                    {theme.suggested_topics && theme.suggested_topics.topics?.length > 0 && (
+                                    {theme.topics_count > 0 && (
                                         <div className="mb-3">
                                             <Badge bg="success" className="me-1">
-                                                {theme.suggested_topics.topics.length} tópicos gerados
+                                                {theme.topics_count} tópicos gerados
                                             </Badge>
                                         </div>
                                     )}
@@ -211,7 +211,7 @@ const ThemesPage: React.FC = () => {
                                         <Link to={`/themes/${theme.id}`} className="btn btn-outline-primary">
                                             Ver Detalhes
                                         </Link>
-                                        {!theme.suggested_topics?.topics?.length && !theme.is_processing && (
+                                        {!theme.topics_count && !theme.is_processing && (
                                             <Button
                                                 variant="success"
                                                 size="sm"
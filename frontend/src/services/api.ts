@@ -65,11 +65,39 @@ export const themesApi = {
     generateTopics: (id: number): Promise<{ task_id: string; message: string }> =>
         api.post(`/api/themes/${id}/generate_topics/`).then(res => res.data),
 
+    bulkGenerateTopics: (themeIds: number[]): Promise<{
+        message: string;
+        tasks: { theme_id: number; task_id: string }[];
+        skipped_theme_ids: number[];
+    }> =>
+        api.post('/api/themes/bulk_generate_topics/', { theme_ids: themeIds }).then(res => res.data),
+
     generatePost: (id: number, data: Omit<GeneratePostRequest, 'theme_id'>): Promise<{ task_id: string; message: string }> =>
         api.post(`/api/themes/${id}/generate_post/`, data).then(res => res.data),
 
-    getPosts: (id: number): Promise<Post[]> =>
-        api.get(`/api/themes/${id}/posts/`).then(res => res.data),
+    generateAllPosts: (id: number, data: { post_type?: 'simple' | 'article'; topics?: string[]; batch?: boolean } = {}): Promise<{
+        message: string;
+        theme_id: number;
+        post_type: 'simple' | 'article';
+        tasks: { topic: string; task_id: string }[];
+        skipped_topics: string[];
+    }> =>
+        api.post(`/api/themes/${id}/generate_all_posts/`, data).then(res => res.data),
+
+    // Cursor-paginated: follows `next` until every post of the theme is loaded
+    getPosts: async (id: number): Promise<Post[]> => {
+        const posts: Post[] = [];
+        let url: string | null = `/api/themes/${id}/posts/?limit=200`;
+        while (url) {
+            const res: { data: { results?: Post[]; next?: string | null } | Post[] } = await api.get(url);
+            if (Array.isArray(res.data)) {
+                return res.data;
+            }
+            posts.push(...(res.data.results || []));
+            url = res.data.next || null;
+        }
+        return posts;
+    },
 
     getStatus: (id: number): Promise<any> =>
         api.get(`/api/themes/${id}/status/`).then(res => res.data),
@@ -106,6 +134,13 @@ export const postsApi = {
 export const tasksApi = {
     checkStatus: (taskId: string): Promise<TaskStatus> =>
         api.get(`/api/tasks/check/?task_id=${taskId}`).then(res => res.data),
+
+    // Server-sent events URL (use with EventSource) pushing each state change
+    streamUrl: (taskId: string): string =>
+        `${API_BASE_URL}/api/tasks/stream/?task_id=${taskId}`,
+
+    checkStatuses: (taskIds: string[]): Promise<{ tasks: TaskStatus[] }> =>
+        api.get(`/api/tasks/bulk_check/?task_ids=${taskIds.join(',')}`).then(res => res.data),
 };
 
 export default api;
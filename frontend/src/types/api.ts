@@ -7,10 +7,12 @@ export interface Theme {
     is_active: boolean;
     processing_status: 'idle' | 'processing' | 'completed' | 'failed';
     is_processing: boolean;
-    suggested_topics: {
+    // Not included in theme listings; use topics_count there
+    suggested_topics?: {
         topics: Topic[];
     } | null;
     topics_generated_at: string | null;
+    topics_count: number;
     posts_count: number;
     articles_count: number;
     simple_posts_count: number;
@@ -56,10 +58,14 @@ export interface DashboardStats {
     draft_posts: number;
     generated_posts: number;
     ai_service: string;
-    recent_posts: Post[];
-    recent_themes: Theme[];
+    recent_posts: DashboardRecentPost[];
+    recent_themes: DashboardRecentTheme[];
 }
 
+export type DashboardRecentPost = Pick<Post, 'id' | 'title' | 'status' | 'post_type' | 'created_at' | 'theme_title'>;
+
+export type DashboardRecentTheme = Pick<Theme, 'id' | 'title' | 'created_at' | 'is_processing' | 'posts_count'>;
+
 export interface TaskStatus {
     task_id: string;
     state: string;
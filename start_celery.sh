@@ -31,5 +31,9 @@ echo ""
 echo "Para parar o worker, pressione Ctrl+C"
 echo ""
 
-# Iniciar worker
+# Iniciar o worker de IA em segundo plano e o worker padrão em primeiro plano
+./scripts/start_ai_worker.sh &
+AI_WORKER_PID=$!
+trap "kill $AI_WORKER_PID 2>/dev/null" EXIT
+
 ./scripts/start_worker.sh